@@ -1405,7 +1405,15 @@ async def run_continuous_learning(model_manager, config: Dict[str, Any]):
 
     # Start WebSocket server
     ws_port = int(os.environ.get("ML_WEBSOCKET_PORT", "8002"))
-    server = await websockets.serve(pipeline.handle_websocket, "localhost", ws_port)
+    # Loopback only: no permessage-deflate, size cap or keepalive pings
+    server = await websockets.serve(
+        pipeline.handle_websocket,
+        "localhost",
+        ws_port,
+        compression=None,
+        max_size=None,
+        ping_interval=None,
+    )
 
     logger.info(
         f"Continuous Learning WebSocket server started on ws://localhost:{ws_port}"
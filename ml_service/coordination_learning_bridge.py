@@ -40,7 +40,7 @@ class CoordinationLearningBridge:
 
     def __init__(
         self,
-        cl_ws_url: str = "ws://localhost:8005/ws",
+        cl_ws_url: str = "ws://localhost:8002/ws",
         coord_ws_url: str = "ws://localhost:8003/ws/continuous_learning",
     ):
         self.cl_ws_url = cl_ws_url
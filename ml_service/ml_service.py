@@ -15,15 +15,17 @@ Enterprise-grade machine learning service featuring:
 
 import asyncio
 import hashlib
+import itertools
 import json
 import logging
 import os
 import sys
+import threading
 import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 # Environment Configuration
 from dotenv import load_dotenv
@@ -32,6 +34,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import numpy as np
+import orjson
 import structlog
 # Core ML and Web Framework
 import torch
@@ -44,7 +47,7 @@ from fastapi.responses import JSONResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from prometheus_client import (CONTENT_TYPE_LATEST, CollectorRegistry, Counter,
                                Gauge, Histogram, generate_latest)
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, conlist
 
 # Create custom registry to avoid conflicts
 custom_registry = CollectorRegistry()
@@ -84,6 +87,7 @@ FALLBACK_TO_RANDOM = os.getenv("FALLBACK_TO_RANDOM", "true").lower() == "true"
 # Inference Configuration
 BATCH_SIZE = int(os.getenv("BATCH_SIZE", 32))
 MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", 128))
+BATCH_WINDOW_MS = float(os.getenv("BATCH_WINDOW_MS", 2))
 INFERENCE_TIMEOUT = int(os.getenv("INFERENCE_TIMEOUT", 5000))
 MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", 50))
 
@@ -159,6 +163,12 @@ print()
 # Set torch threads
 torch.set_num_threads(NUM_THREADS)
 
+# oneDNN kernels back the channels-last conv path on CPU
+torch.backends.mkldnn.enabled = True
+
+# Inputs have fixed shapes, so let cuDNN autotune conv algorithms once
+torch.backends.cudnn.benchmark = True
+
 # -----------------------------------------------------------------------------
 # Enhanced Logging Configuration
 # -----------------------------------------------------------------------------
@@ -192,6 +202,46 @@ REQUEST_COUNT = Counter(
     ["method", "endpoint", "status"],
     registry=custom_registry,
 )
+
+
+class BufferedCounter:
+    """Labelled counter whose increments are buffered per thread and flushed in bulk
+
+    Each thread only ever writes its own buffer, and buffers only grow, so
+    flushing pushes the delta since the previous flush without any locking
+    on the request path.
+    """
+
+    def __init__(self, counter: Counter):
+        self.counter = counter
+        self._local = threading.local()
+        # (thread buffer, totals already flushed) per thread
+        self._buffers: List[Tuple[Dict[tuple, int], Dict[tuple, int]]] = []
+        self._lock = threading.Lock()
+
+    def inc_local(self, *labelvalues: str) -> None:
+        """Record one increment for the given label values"""
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = self._local.buffer = {}
+            with self._lock:
+                self._buffers.append((buffer, {}))
+        buffer[labelvalues] = buffer.get(labelvalues, 0) + 1
+
+    def flush(self) -> None:
+        """Push buffered increments to the underlying Prometheus counter"""
+        with self._lock:
+            for buffer, flushed in self._buffers:
+                for labelvalues, total in buffer.copy().items():
+                    delta = total - flushed.get(labelvalues, 0)
+                    if delta:
+                        self.counter.labels(*labelvalues).inc(delta)
+                        flushed[labelvalues] = total
+
+
+REQUEST_COUNT_BUFFER = BufferedCounter(REQUEST_COUNT)
+METRICS_FLUSH_INTERVAL = 1.0
+
 REQUEST_DURATION = Histogram(
     "ml_request_duration_seconds",
     "Request duration",
@@ -314,12 +364,26 @@ config = MLServiceConfig()
 # -----------------------------------------------------------------------------
 # Enhanced Data Models
 # -----------------------------------------------------------------------------
+# Board shapes are encoded in the types so pydantic-core validates them natively
+BoardCell = Literal["Empty", "Red", "Yellow"]
+StringBoard = conlist(
+    conlist(BoardCell, min_length=7, max_length=7), min_length=6, max_length=6
+)
+TensorBoard = conlist(
+    conlist(conlist(float, min_length=7, max_length=7), min_length=6, max_length=6),
+    min_length=2,
+    max_length=2,
+)
+
+
 class BoardInput(BaseModel):
     """Enhanced board input with validation and metadata"""
 
+    model_config = ConfigDict(extra="ignore", frozen=True, protected_namespaces=())
+
     board: Union[
-        List[List[str]],  # 6×7 string format
-        List[List[List[float]]],  # 2×6×7 tensor format
+        StringBoard,  # 6×7 string format
+        TensorBoard,  # 2×6×7 tensor format
     ] = Field(..., description="Connect4 board state")
 
     # Optional metadata
@@ -337,35 +401,14 @@ class BoardInput(BaseModel):
         True, description="Include uncertainty estimation"
     )
 
-    @field_validator("board")
-    def validate_board_structure(cls, v):
-        """Validate board structure"""
-        if isinstance(v, list) and len(v) == 2:
-            # Tensor format validation
-            if all(isinstance(layer, list) and len(layer) == 6 for layer in v):
-                if all(
-                    isinstance(row, list) and len(row) == 7
-                    for layer in v
-                    for row in layer
-                ):
-                    return v
-        elif isinstance(v, list) and len(v) == 6:
-            # String format validation
-            if all(isinstance(row, list) and len(row) == 7 for row in v):
-                valid_values = {"Empty", "Red", "Yellow"}
-                if all(cell in valid_values for row in v for cell in row):
-                    return v
-
-        raise ValueError(
-            "Invalid board structure. Expected 6×7 string matrix or 2×6×7 tensor"
-        )
-
 
 class BatchPredictionRequest(BaseModel):
     """Batch prediction request"""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     boards: List[BoardInput] = Field(
-        ..., max_items=32, description="Batch of board states"
+        ..., max_length=32, description="Batch of board states"
     )
     batch_id: Optional[str] = Field(None, description="Batch identifier")
     priority: Optional[str] = Field("normal", description="Batch priority")
@@ -374,6 +417,8 @@ class BatchPredictionRequest(BaseModel):
 class PredictionResponse(BaseModel):
     """Enhanced prediction response with comprehensive information"""
 
+    model_config = ConfigDict(extra="ignore", frozen=True, protected_namespaces=())
+
     # Core prediction
     move: int = Field(..., ge=0, le=6, description="Recommended move column")
     probs: List[float] = Field(..., description="Move probabilities for all columns")
@@ -434,6 +479,21 @@ class ModelManager:
         self.model_metadata: Dict[str, Dict[str, Any]] = {}
         self.load_times: Dict[str, float] = {}
         self.request_counts: Dict[str, int] = {}
+        # Resolved once per load so weight export needs no attribute probing
+        self.weight_extractors: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+    @staticmethod
+    def _build_weight_extractor(
+        model: torch.nn.Module,
+    ) -> Callable[[], Dict[str, Any]]:
+        """Pick the state-dict export for a model's layout"""
+        if hasattr(model, "policy_net"):
+            # AlphaZero style model
+            return lambda: {
+                "policy_net": model.policy_net.state_dict(),
+                "value_net": model.value_net.state_dict(),
+            }
+        return model.state_dict
 
     async def load_model(
         self, model_type: str, model_path: Optional[str] = None
@@ -477,6 +537,7 @@ class ModelManager:
 
             # Store model and metadata
             self.models[model_type] = model
+            self.weight_extractors[model_type] = self._build_weight_extractor(model)
             load_time = time.time() - start_time
             self.load_times[model_type] = load_time
             self.request_counts[model_type] = 0
@@ -612,8 +673,10 @@ class CacheManager:
         key_data = f"{board_str}:{model_type}"
         return hashlib.sha256(key_data.encode()).hexdigest()
 
-    async def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Get value from cache"""
+    async def _lookup(
+        self, cache_key: str, decode: Callable[[Any], Any]
+    ) -> Optional[Any]:
+        """Shared get path; decode turns a Redis value into the cached type"""
         try:
             # Try Redis first
             if self.redis_client:
@@ -621,7 +684,7 @@ class CacheManager:
                 if value:
                     self.cache_stats["hits"] += 1
                     CACHE_HITS.labels(cache_type="redis").inc()
-                    return json.loads(value)
+                    return decode(value)
 
             # Fallback to memory cache
             if cache_key in self.memory_cache:
@@ -643,16 +706,20 @@ class CacheManager:
             logger.warning("Cache get error", error=str(e))
             return None
 
-    async def set(
-        self, cache_key: str, value: Dict[str, Any], ttl: Optional[int] = None
+    async def _store(
+        self,
+        cache_key: str,
+        value: Any,
+        encode: Callable[[Any], Any],
+        ttl: Optional[int] = None,
     ):
-        """Set value in cache"""
+        """Shared set path; encode turns the value into what Redis stores"""
         ttl = ttl or config.CACHE_TTL
 
         try:
             # Store in Redis
             if self.redis_client:
-                await self.redis_client.setex(cache_key, ttl, json.dumps(value))
+                await self.redis_client.setex(cache_key, ttl, encode(value))
 
             # Store in memory cache
             expiry = time.time() + ttl
@@ -670,6 +737,28 @@ class CacheManager:
         except Exception as e:
             logger.warning("Cache set error", error=str(e))
 
+    @staticmethod
+    def _as_bytes(value: Union[str, bytes]) -> bytes:
+        return value.encode() if isinstance(value, str) else value
+
+    async def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Get value from cache"""
+        return await self._lookup(cache_key, json.loads)
+
+    async def set(
+        self, cache_key: str, value: Dict[str, Any], ttl: Optional[int] = None
+    ):
+        """Set value in cache"""
+        await self._store(cache_key, value, json.dumps, ttl)
+
+    async def get_raw(self, cache_key: str) -> Optional[bytes]:
+        """Get pre-encoded JSON bytes from cache"""
+        return await self._lookup(cache_key, self._as_bytes)
+
+    async def set_raw(self, cache_key: str, value: bytes, ttl: Optional[int] = None):
+        """Set pre-encoded JSON bytes in cache without re-serializing"""
+        await self._store(cache_key, value, bytes, ttl)
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         total = self.cache_stats["hits"] + self.cache_stats["misses"]
@@ -776,27 +865,53 @@ class InferenceEngine:
         include_uncertainty: bool = True,
     ) -> Dict[str, Any]:
         """Perform prediction with comprehensive output"""
+        results = await InferenceEngine.predict_batch(model, board_tensor, model_type)
+        return results[0]
+
+    @staticmethod
+    async def predict_batch(
+        model: torch.nn.Module,
+        board_tensors: torch.Tensor,
+        model_type: str,
+    ) -> List[Dict[str, Any]]:
+        """Run one forward pass over stacked boards and split per-board results"""
         start_time = time.time()
 
         try:
-            with torch.no_grad():
-                # Simple prediction for compatibility
-                logits = model(board_tensor)[0]
-                probs = F.softmax(logits, dim=0).cpu().tolist()
-                move = int(torch.argmax(logits).item())
-
-                result = {"probs": probs, "move": move, "confidence": max(probs)}
-
-                # Add alternatives
-                prob_tensor = F.softmax(logits, dim=0)
-                top_moves = torch.topk(prob_tensor, min(3, len(probs)))
-                result["alternatives"] = [
-                    {"move": int(idx.item()), "probability": float(prob.item())}
-                    for prob, idx in zip(top_moves.values, top_moves.indices)
-                ]
+            # Reduced precision on CUDA only; softmax runs in float32 for stable probs
+            with torch.inference_mode(), torch.autocast(
+                device_type=config.DEVICE.type,
+                dtype=torch.bfloat16,
+                enabled=config.DEVICE.type == "cuda",
+            ):
+                logits = model(board_tensors).float()
+                prob_tensor = F.softmax(logits, dim=1)
+                top_moves = torch.topk(prob_tensor, min(3, prob_tensor.size(1)))
+
+            probs_batch = prob_tensor.cpu().tolist()
+            moves = torch.argmax(logits, dim=1).cpu().tolist()
+            top_values = top_moves.values.cpu().tolist()
+            top_indices = top_moves.indices.cpu().tolist()
 
             inference_time = (time.time() - start_time) * 1000  # Convert to ms
-            result["inference_time_ms"] = inference_time
+
+            results = []
+            for probs, move, values, indices in zip(
+                probs_batch, moves, top_values, top_indices
+            ):
+                results.append(
+                    {
+                        "probs": probs,
+                        "move": int(move),
+                        "confidence": max(probs),
+                        # Add alternatives
+                        "alternatives": [
+                            {"move": int(idx), "probability": float(prob)}
+                            for prob, idx in zip(values, indices)
+                        ],
+                        "inference_time_ms": inference_time,
+                    }
+                )
 
             # Update metrics
             INFERENCE_DURATION.labels(model_type=model_type).observe(
@@ -804,9 +919,9 @@ class InferenceEngine:
             )
             MODEL_PREDICTIONS.labels(
                 model_name=model_type, model_version="latest"
-            ).inc()
+            ).inc(len(results))
 
-            return result
+            return results
 
         except Exception as e:
             logger.error("Inference failed", model_type=model_type, error=str(e))
@@ -818,6 +933,100 @@ class InferenceEngine:
 
 inference_engine = InferenceEngine()
 
+
+class BatchedInferenceQueue:
+    """Coalesces concurrent predictions into one forward pass per model"""
+
+    def __init__(self, max_batch_size: int, window_ms: float):
+        self.max_batch_size = max_batch_size
+        self.window = window_ms / 1000
+        self.queue: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the consumer task on the running event loop"""
+        self.queue = asyncio.Queue()
+        self._consumer = asyncio.create_task(self._run())
+        logger.info(
+            "Batched inference started",
+            max_batch_size=self.max_batch_size,
+            window_ms=self.window * 1000,
+        )
+
+    async def stop(self):
+        """Cancel the consumer task"""
+        if self._consumer is None:
+            return
+        self._consumer.cancel()
+        try:
+            await self._consumer
+        except asyncio.CancelledError:
+            pass
+        self._consumer = None
+
+    async def submit(
+        self, model: torch.nn.Module, board_tensor: torch.Tensor, model_type: str
+    ) -> Dict[str, Any]:
+        """Queue a single board and wait for its slice of the batched result"""
+        if self._consumer is None:
+            return await inference_engine.predict(model, board_tensor, model_type)
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((model, board_tensor, model_type, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+
+            # Only wait for more work when other requests are already queued,
+            # so a lone request on a cold path pays no extra latency
+            if not self.queue.empty():
+                deadline = loop.time() + self.window
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self.queue.get(), timeout)
+                        )
+                    except asyncio.TimeoutError:
+                        break
+
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: List[Tuple[Any, ...]]):
+        groups: Dict[str, List[Tuple[Any, ...]]] = {}
+        for item in batch:
+            groups.setdefault(item[2], []).append(item)
+
+        for model_type, items in groups.items():
+            model = items[0][0]
+            try:
+                if len(items) == 1:
+                    results = [
+                        await inference_engine.predict(model, items[0][1], model_type)
+                    ]
+                else:
+                    stacked = torch.cat([item[1] for item in items], dim=0)
+                    results = await inference_engine.predict_batch(
+                        model, stacked, model_type
+                    )
+                for item, result in zip(items, results):
+                    if not item[3].done():
+                        item[3].set_result(result)
+            except Exception as e:
+                for item in items:
+                    if not item[3].done():
+                        item[3].set_exception(e)
+
+
+batched_inference = BatchedInferenceQueue(
+    max_batch_size=config.MAX_BATCH_SIZE, window_ms=BATCH_WINDOW_MS
+)
+
 # -----------------------------------------------------------------------------
 # Security and Authentication
 # -----------------------------------------------------------------------------
@@ -876,33 +1085,80 @@ async def lifespan(app: FastAPI):
     if config.WARMUP_REQUESTS > 0:
         await warmup_models()
 
+    batched_inference.start()
+    metrics_flusher = asyncio.create_task(flush_request_counts())
+
     logger.info("ML service startup complete")
 
     yield
 
     # Shutdown
     logger.info("Shutting down ML service")
+    metrics_flusher.cancel()
+    REQUEST_COUNT_BUFFER.flush()
+    await batched_inference.stop()
     if cache_manager.redis_client:
         await cache_manager.redis_client.close()
 
 
+async def flush_request_counts():
+    """Periodically push buffered request counts to Prometheus"""
+    while True:
+        await asyncio.sleep(METRICS_FLUSH_INTERVAL)
+        REQUEST_COUNT_BUFFER.flush()
+
+
+def _board_from_rows(rows: Tuple[str, ...]) -> List[List[str]]:
+    """Build a string board from compact rows ('.', 'R', 'Y')"""
+    cells = {".": "Empty", "R": "Red", "Y": "Yellow"}
+    return [[cells[c] for c in row] for row in rows]
+
+
+# Representative positions so warmup covers the value ranges seen in play
+WARMUP_BOARDS = [
+    # Opening
+    _board_from_rows(
+        (".......", ".......", ".......", ".......", ".......", ".......")
+    ),
+    # Early game
+    _board_from_rows(
+        (".......", ".......", ".......", ".......", "...Y...", "..RRY..")
+    ),
+    # Midgame
+    _board_from_rows(
+        (".......", ".......", "...R...", "..YY...", "..RRY..", ".YRRYR.")
+    ),
+    # Endgame
+    _board_from_rows(
+        ("R.Y..Y.", "YRRY.RY", "RYYRYYR", "YRRYRRY", "RYYRYYR", "YRRYRRY")
+    ),
+]
+
+
 async def warmup_models():
-    """Warm up models with dummy requests"""
+    """Warm up models with representative boards"""
     logger.info("Starting model warmup", requests=config.WARMUP_REQUESTS)
 
-    # Create dummy board
-    dummy_board = [["Empty" for _ in range(7)] for _ in range(6)]
+    model_type = config.DEFAULT_MODEL_TYPE
+    tensors = [inference_engine.convert_board_to_tensor(b) for b in WARMUP_BOARDS]
 
+    # Cycle through the boards so each one runs at least twice by default
     for i in range(config.WARMUP_REQUESTS):
         try:
-            model = await model_manager.get_model(config.DEFAULT_MODEL_TYPE)
-            tensor = inference_engine.convert_board_to_tensor(dummy_board)
+            model = await model_manager.get_model(model_type)
             await inference_engine.predict(
-                model, tensor, config.DEFAULT_MODEL_TYPE, False
+                model, tensors[i % len(tensors)], model_type, False
             )
         except Exception as e:
             logger.warning("Warmup request failed", iteration=i, error=str(e))
 
+    # Also warm the stacked shape used by batched inference
+    try:
+        model = await model_manager.get_model(model_type)
+        await inference_engine.predict_batch(model, torch.cat(tensors), model_type)
+    except Exception as e:
+        logger.warning("Batched warmup failed", error=str(e))
+
     logger.info("Model warmup complete")
 
 
@@ -960,11 +1216,9 @@ async def request_middleware(request: Request, call_next):
             method=request.method, endpoint=request.url.path
         ).observe(duration)
 
-        REQUEST_COUNT.labels(
-            method=request.method,
-            endpoint=request.url.path,
-            status=str(response.status_code),
-        ).inc()
+        REQUEST_COUNT_BUFFER.inc_local(
+            request.method, request.url.path, str(response.status_code)
+        )
 
         logger.info(
             "Request completed",
@@ -977,9 +1231,7 @@ async def request_middleware(request: Request, call_next):
 
     except Exception as e:
         logger.error("Request failed", error=str(e))
-        REQUEST_COUNT.labels(
-            method=request.method, endpoint=request.url.path, status="500"
-        ).inc()
+        REQUEST_COUNT_BUFFER.inc_local(request.method, request.url.path, "500")
         raise
     finally:
         ACTIVE_CONNECTIONS.dec()
@@ -1071,6 +1323,31 @@ async def health_check():
         )
 
 
+# Request ids only need to be unique; next() on a count is atomic under the GIL
+_request_counter = itertools.count()
+
+# Per-request fields that are appended to the cached prediction payload
+_DYNAMIC_RESPONSE_FIELDS = {"cache_hit", "request_id", "timestamp"}
+
+
+def _finalize_prediction_body(
+    cached_body: bytes, request_id: str, cache_hit: bool
+) -> bytes:
+    """Append per-request fields to an encoded prediction payload"""
+    return b"".join(
+        (
+            cached_body[:-1],
+            b',"cache_hit":',
+            b"true" if cache_hit else b"false",
+            b',"request_id":',
+            orjson.dumps(request_id),
+            b',"timestamp":',
+            orjson.dumps(time.time()),
+            b"}",
+        )
+    )
+
+
 @app.post("/predict", response_model=PredictionResponse)
 async def predict_move(
     board_input: BoardInput,
@@ -1081,7 +1358,7 @@ async def predict_move(
 ):
     """Advanced prediction endpoint with caching and comprehensive features"""
     start_time = time.time()
-    request_id = f"req_{int(time.time() * 1000)}_{hash(str(board_input.board)) % 10000}"
+    request_id = f"req_{time.time_ns()}_{next(_request_counter)}"
 
     try:
         # Determine model type
@@ -1092,13 +1369,14 @@ async def predict_move(
             {"board": board_input.board, "model_type": model_type}
         )
 
-        cached_result = await cache_manager.get(cache_key)
-        if cached_result:
-            cached_result["cache_hit"] = True
-            cached_result["request_id"] = request_id
-            cached_result["timestamp"] = time.time()
+        # Cache hits are returned as raw bytes without rebuilding the model
+        cached_body = await cache_manager.get_raw(cache_key)
+        if cached_body:
             logger.info("Cache hit", request_id=request_id)
-            return PredictionResponse(**cached_result)
+            return Response(
+                content=_finalize_prediction_body(cached_body, request_id, True),
+                media_type="application/json",
+            )
 
         # Get model
         model = await model_manager.get_model(model_type)
@@ -1106,9 +1384,9 @@ async def predict_move(
         # Convert board to tensor
         board_tensor = inference_engine.convert_board_to_tensor(board_input.board)
 
-        # Perform inference
-        prediction_result = await inference_engine.predict(
-            model, board_tensor, model_type, board_input.include_uncertainty or False
+        # Perform inference (coalesced with concurrent requests)
+        prediction_result = await batched_inference.submit(
+            model, board_tensor, model_type
         )
 
         # Build response
@@ -1127,9 +1405,11 @@ async def predict_move(
             alternatives=prediction_result.get("alternatives"),
         )
 
-        # Cache result asynchronously
-        cache_data = response_data.dict()
-        background_tasks.add_task(cache_manager.set, cache_key, cache_data)
+        # Encode once; the same bytes are cached and sent to the client
+        cached_body = orjson.dumps(
+            response_data.model_dump(mode="json", exclude=_DYNAMIC_RESPONSE_FIELDS)
+        )
+        background_tasks.add_task(cache_manager.set_raw, cache_key, cached_body)
 
         total_time = (time.time() - start_time) * 1000
         logger.info(
@@ -1141,7 +1421,10 @@ async def predict_move(
             total_time_ms=total_time,
         )
 
-        return response_data
+        return Response(
+            content=_finalize_prediction_body(cached_body, request_id, False),
+            media_type="application/json",
+        )
 
     except HTTPException:
         raise
@@ -1191,7 +1474,7 @@ async def batch_predict(
                     True,
                     None,
                 )
-                results.append(pred_response.dict())
+                results.append(orjson.loads(pred_response.body))
             except Exception as e:
                 logger.error(
                     "Batch item failed", batch_id=batch_id, item=i, error=str(e)
@@ -1268,6 +1551,7 @@ async def load_model_endpoint(model_type: str, _: bool = Depends(verify_api_key)
 @app.get("/metrics")
 async def get_metrics():
     """Prometheus metrics endpoint"""
+    REQUEST_COUNT_BUFFER.flush()
     return Response(generate_latest(custom_registry), media_type=CONTENT_TYPE_LATEST)
 
 
@@ -8,10 +8,12 @@ real-time model updates across all services.
 
 import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
 import torch
 from fastapi import APIRouter, BackgroundTasks, HTTPException
 from pydantic import BaseModel
@@ -21,6 +23,84 @@ logger = logging.getLogger(__name__)
 # Create router for model sync endpoints
 router = APIRouter(prefix="/models", tags=["Model Synchronization"])
 
+# Metadata updates are appended to a JSONL log and folded into the
+# canonical {model_type}_metadata.json every METADATA_COMPACT_EVERY appends
+METADATA_DIR = Path("models")
+METADATA_COMPACT_EVERY = int(os.getenv("METADATA_COMPACT_EVERY", "50"))
+_metadata_appends: Dict[str, int] = {}
+
+
+def _metadata_paths(model_type: str):
+    return (
+        METADATA_DIR / f"{model_type}_metadata.json",
+        METADATA_DIR / f"{model_type}_metadata.jsonl",
+    )
+
+
+def _read_last_line(path: Path, block_size: int = 4096) -> Optional[bytes]:
+    """Read the last non-empty line of a file by scanning backwards"""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        tail = b""
+        while position > 0:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            tail = f.read(step) + tail
+            stripped = tail.rstrip(b"\n")
+            newline = stripped.rfind(b"\n")
+            if newline != -1:
+                return stripped[newline + 1 :]
+        stripped = tail.rstrip(b"\n")
+        return stripped or None
+
+
+def read_model_metadata(model_type: str) -> Optional[Dict[str, Any]]:
+    """Return the most recent metadata record for a model, if any"""
+    json_path, log_path = _metadata_paths(model_type)
+
+    if log_path.exists():
+        last_line = _read_last_line(log_path)
+        if last_line:
+            return orjson.loads(last_line)
+
+    if json_path.exists():
+        with open(json_path, "r") as f:
+            return json.load(f)
+
+    return None
+
+
+def compact_model_metadata(model_type: str) -> None:
+    """Fold the append log into the canonical metadata file"""
+    json_path, log_path = _metadata_paths(model_type)
+    metadata = read_model_metadata(model_type)
+    if metadata is None:
+        return
+
+    tmp_path = json_path.with_suffix(".json.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(metadata, f, indent=2)
+    os.replace(tmp_path, json_path)
+
+    if log_path.exists():
+        log_path.unlink()
+    _metadata_appends[model_type] = 0
+
+
+def write_model_metadata(model_type: str, metadata: Dict[str, Any]) -> None:
+    """Append a metadata record, compacting the log periodically"""
+    _, log_path = _metadata_paths(model_type)
+    METADATA_DIR.mkdir(parents=True, exist_ok=True)
+
+    with open(log_path, "ab") as f:
+        f.write(orjson.dumps(metadata) + b"\n")
+
+    _metadata_appends[model_type] = _metadata_appends.get(model_type, 0) + 1
+    if _metadata_appends[model_type] >= METADATA_COMPACT_EVERY:
+        compact_model_metadata(model_type)
+
 
 class ModelSyncRequest(BaseModel):
     """Request for model synchronization"""
@@ -96,18 +176,16 @@ def setup_model_sync_routes(app, model_manager):
                 )
 
             # Get model metadata if available
-            metadata_file = Path(f"models/{model_type}_metadata.json")
-            if metadata_file.exists():
-                with open(metadata_file, "r") as f:
-                    metadata = json.load(f)
-                    return ModelVersionInfo(
-                        version=metadata.get("version", "1.0.0"),
-                        timestamp=datetime.fromisoformat(
-                            metadata.get("timestamp", datetime.now().isoformat())
-                        ),
-                        performance=metadata.get("performance"),
-                        metadata=metadata,
-                    )
+            metadata = read_model_metadata(model_type)
+            if metadata is not None:
+                return ModelVersionInfo(
+                    version=metadata.get("version", "1.0.0"),
+                    timestamp=datetime.fromisoformat(
+                        metadata.get("timestamp", datetime.now().isoformat())
+                    ),
+                    performance=metadata.get("performance"),
+                    metadata=metadata,
+                )
 
             # Default response if no metadata
             return ModelVersionInfo(
@@ -129,30 +207,13 @@ def setup_model_sync_routes(app, model_manager):
                     status_code=404, detail=f"Model {model_type} not found"
                 )
 
-            model = model_manager.models[model_type]
-
-            # Get model state dict
-            if hasattr(model, "policy_net"):
-                # AlphaZero style model
-                weights = {
-                    "policy_net": model.policy_net.state_dict(),
-                    "value_net": model.value_net.state_dict(),
-                }
-            elif hasattr(model, "state_dict"):
-                # PyTorch model
-                weights = model.state_dict()
-            else:
-                weights = None
+            # Get model state dict via the extractor resolved at load time
+            extractor = model_manager.weight_extractors.get(model_type)
+            weights = extractor() if extractor is not None else None
 
             # Get metadata
-            metadata_file = Path(f"models/{model_type}_metadata.json")
-            metadata = {}
-            version = "1.0.0"
-
-            if metadata_file.exists():
-                with open(metadata_file, "r") as f:
-                    metadata = json.load(f)
-                    version = metadata.get("version", "1.0.0")
+            metadata = read_model_metadata(model_type) or {}
+            version = metadata.get("version", "1.0.0")
 
             return {
                 "modelType": model_type,
@@ -200,15 +261,12 @@ def setup_model_sync_routes(app, model_manager):
             logger.info(f"🌟 Promoting {model_type} to version {version}")
 
             # Update metadata
-            metadata_file = Path(f"models/{model_type}_metadata.json")
             metadata = {
                 "version": version,
                 "promoted_at": datetime.now().isoformat(),
                 "promoted_by": "integration_system",
             }
-
-            with open(metadata_file, "w") as f:
-                json.dump(metadata, f, indent=2)
+            write_model_metadata(model_type, metadata)
 
             # Notify integration system
             if hasattr(model_manager, "integration_client"):
@@ -250,7 +308,6 @@ async def update_model_async(
             logger.info(f"💾 Saved model weights to {model_path}")
 
         # Update metadata
-        metadata_file = Path(f"models/{model_type}_metadata.json")
         model_metadata = metadata or {}
         model_metadata.update(
             {
@@ -260,8 +317,7 @@ async def update_model_async(
             }
         )
 
-        with open(metadata_file, "w") as f:
-            json.dump(model_metadata, f, indent=2)
+        write_model_metadata(model_type, model_metadata)
 
         # Reload model if it's currently loaded
         if model_type in model_manager.models:
@@ -6,7 +6,27 @@ Simple client test to verify ML service HTTP endpoints
 import asyncio
 import json
 
-import httpx
+import aiohttp
+import orjson
+
+# Rows are copied per use, so the template itself is never mutated
+EMPTY_BOARD = [["Empty"] * 7 for _ in range(6)]
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def new_board():
+    """Return a fresh mutable copy of the empty board"""
+    return [row[:] for row in EMPTY_BOARD]
+
+
+async def post_json(client, url, payload):
+    """POST a JSON payload and return (status, decoded body or None)"""
+    async with client.post(
+        url, data=orjson.dumps(payload), headers=JSON_HEADERS
+    ) as response:
+        if response.status != 200:
+            return response.status, None
+        return response.status, await response.json(loads=orjson.loads)
 
 
 async def test_ml_service():
@@ -16,22 +36,32 @@ async def test_ml_service():
     base_url = "http://localhost:8001"
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),
+            # All requests go to one host: cap the pool there and keep
+            # sockets (and the resolved address) alive across the whole run
+            connector=aiohttp.TCPConnector(
+                limit=16,
+                limit_per_host=16,
+                keepalive_timeout=30.0,
+                ttl_dns_cache=300,
+            ),
+        ) as client:
             # Test health check
             print("\n🏥 Testing health check...")
-            response = await client.get(f"{base_url}/health")
-            if response.status_code == 200:
-                health_data = response.json()
-                print(f"✅ Health check: {health_data['status']}")
-                print(f"   Device: {health_data['device']}")
-                print(f"   Models: {health_data['models_loaded']}")
-            else:
-                print(f"❌ Health check failed: {response.status_code}")
-                return
+            async with client.get(f"{base_url}/health") as response:
+                if response.status == 200:
+                    health_data = await response.json(loads=orjson.loads)
+                    print(f"✅ Health check: {health_data['status']}")
+                    print(f"   Device: {health_data['device']}")
+                    print(f"   Models: {health_data['models_loaded']}")
+                else:
+                    print(f"❌ Health check failed: {response.status}")
+                    return
 
             # Test basic prediction
             print("\n🎯 Testing basic prediction...")
-            test_board = [["Empty" for _ in range(7)] for _ in range(6)]
+            test_board = new_board()
             test_board[5][3] = "Red"
             test_board[5][4] = "Yellow"
 
@@ -40,105 +70,130 @@ async def test_ml_service():
                 "game_id": "client_test_001",
                 "include_uncertainty": True,
             }
-
-            response = await client.post(f"{base_url}/predict", json=prediction_request)
-            if response.status_code == 200:
-                prediction_data = response.json()
-                print(f"✅ Basic prediction: move {prediction_data['move']}")
-                print(f"   Confidence: {prediction_data['confidence']:.3f}")
-                print(
-                    f"   Inference time: {prediction_data['inference_time_ms']:.1f}ms"
-                )
-                print(f"   Model: {prediction_data['model_type']}")
-                print(f"   Cache hit: {prediction_data['cache_hit']}")
-            else:
-                print(f"❌ Basic prediction failed: {response.status_code}")
-                print(f"   Error: {response.text}")
-                return
+            # Encoded once and reused for the cache check below
+            prediction_body = orjson.dumps(prediction_request)
+
+            async with client.post(
+                f"{base_url}/predict", data=prediction_body, headers=JSON_HEADERS
+            ) as response:
+                if response.status == 200:
+                    prediction_data = await response.json(loads=orjson.loads)
+                    print(f"✅ Basic prediction: move {prediction_data['move']}")
+                    print(f"   Confidence: {prediction_data['confidence']:.3f}")
+                    print(
+                        f"   Inference time: {prediction_data['inference_time_ms']:.1f}ms"
+                    )
+                    print(f"   Model: {prediction_data['model_type']}")
+                    print(f"   Cache hit: {prediction_data['cache_hit']}")
+                else:
+                    print(f"❌ Basic prediction failed: {response.status}")
+                    print(f"   Error: {await response.text()}")
+                    return
 
             # Test caching (second request should be cached)
             print("\n💾 Testing caching...")
-            response = await client.post(f"{base_url}/predict", json=prediction_request)
-            if response.status_code == 200:
-                cached_data = response.json()
-                print(f"✅ Cached prediction: move {cached_data['move']}")
-                print(f"   Cache hit: {cached_data['cache_hit']}")
-                print(f"   Inference time: {cached_data['inference_time_ms']:.1f}ms")
-            else:
-                print(f"❌ Cached prediction failed: {response.status_code}")
-
-            # Test different model types
-            print("\n🎮 Testing different model types...")
-            for model_type in ["lightweight", "standard", "heavyweight", "legacy"]:
-                request = {
-                    "board": test_board,
-                    "model_type": model_type,
-                    "game_id": f"model_test_{model_type}",
-                }
-
-                response = await client.post(f"{base_url}/predict", json=request)
-                if response.status_code == 200:
-                    data = response.json()
+            async with client.post(
+                f"{base_url}/predict", data=prediction_body, headers=JSON_HEADERS
+            ) as response:
+                if response.status == 200:
+                    cached_data = await response.json(loads=orjson.loads)
+                    print(f"✅ Cached prediction: move {cached_data['move']}")
+                    print(f"   Cache hit: {cached_data['cache_hit']}")
                     print(
-                        f"✅ {model_type}: move {data['move']}, "
-                        f"confidence {data['confidence']:.3f}, "
-                        f"time {data['inference_time_ms']:.1f}ms"
+                        f"   Inference time: {cached_data['inference_time_ms']:.1f}ms"
                     )
                 else:
-                    print(f"❌ {model_type}: failed ({response.status_code})")
+                    print(f"❌ Cached prediction failed: {response.status}")
+
+            # Test different model types in one /predict/batch round trip;
+            # the server honors model_type per board
+            print("\n🎮 Testing different model types...")
+            model_types = ["lightweight", "standard", "heavyweight", "legacy"]
+            status, sweep_data = await post_json(
+                client,
+                f"{base_url}/predict/batch",
+                {
+                    "boards": [
+                        {
+                            "board": test_board,
+                            "model_type": model_type,
+                            "game_id": f"model_test_{model_type}",
+                        }
+                        for model_type in model_types
+                    ],
+                    "batch_id": "model_type_sweep",
+                },
+            )
+            if status == 200:
+                # Results come back in request order
+                for model_type, data in zip(model_types, sweep_data["results"]):
+                    if "error" not in data:
+                        print(
+                            f"✅ {model_type}: move {data['move']}, "
+                            f"confidence {data['confidence']:.3f}, "
+                            f"time {data['inference_time_ms']:.1f}ms"
+                        )
+                    else:
+                        print(f"❌ {model_type}: failed ({data['error']})")
+            else:
+                print(f"❌ Model type sweep failed: {status}")
 
             # Test batch prediction
             print("\n📦 Testing batch prediction...")
             batch_boards = []
             for i in range(3):
-                board = [["Empty" for _ in range(7)] for _ in range(6)]
+                board = new_board()
                 if i > 0:
                     board[5][i] = "Red"
                 batch_boards.append({"board": board, "game_id": f"batch_test_{i}"})
 
             batch_request = {"boards": batch_boards, "batch_id": "client_test_batch"}
 
-            response = await client.post(
-                f"{base_url}/predict/batch", json=batch_request
-            )
-            if response.status_code == 200:
-                batch_data = response.json()
-                print(
-                    f"✅ Batch prediction: {batch_data['successful_count']}/{len(batch_boards)} successful"
-                )
-                print(f"   Total time: {batch_data['total_time_ms']:.1f}ms")
-                print(
-                    f"   Avg per board: {batch_data['total_time_ms']/len(batch_boards):.1f}ms"
-                )
-            else:
-                print(f"❌ Batch prediction failed: {response.status_code}")
+            async with client.post(
+                f"{base_url}/predict/batch",
+                data=orjson.dumps(batch_request),
+                headers=JSON_HEADERS,
+            ) as response:
+                if response.status == 200:
+                    batch_data = await response.json(loads=orjson.loads)
+                    print(
+                        f"✅ Batch prediction: {batch_data['successful_count']}/{len(batch_boards)} successful"
+                    )
+                    print(f"   Total time: {batch_data['total_time_ms']:.1f}ms")
+                    print(
+                        f"   Avg per board: {batch_data['total_time_ms']/len(batch_boards):.1f}ms"
+                    )
+                else:
+                    print(f"❌ Batch prediction failed: {response.status}")
 
             # Test models endpoint
             print("\n🔧 Testing models endpoint...")
-            response = await client.get(f"{base_url}/models")
-            if response.status_code == 200:
-                models_data = response.json()
-                print(f"✅ Models endpoint: {models_data['available_models']}")
-                print(f"   Default: {models_data['default_model']}")
-            else:
-                print(f"❌ Models endpoint failed: {response.status_code}")
+            async with client.get(f"{base_url}/models") as response:
+                if response.status == 200:
+                    models_data = await response.json(loads=orjson.loads)
+                    print(f"✅ Models endpoint: {models_data['available_models']}")
+                    print(f"   Default: {models_data['default_model']}")
+                else:
+                    print(f"❌ Models endpoint failed: {response.status}")
 
             # Test stats endpoint
             print("\n📊 Testing stats endpoint...")
-            response = await client.get(f"{base_url}/stats")
-            if response.status_code == 200:
-                stats_data = response.json()
-                print(f"✅ Stats endpoint: version {stats_data['service']['version']}")
-                print(
-                    f"   Total requests: {stats_data['performance']['total_requests']}"
-                )
-                print(f"   Cache hit rate: {stats_data['cache']['hit_rate']:.3f}")
-            else:
-                print(f"❌ Stats endpoint failed: {response.status_code}")
+            async with client.get(f"{base_url}/stats") as response:
+                if response.status == 200:
+                    stats_data = await response.json(loads=orjson.loads)
+                    print(
+                        f"✅ Stats endpoint: version {stats_data['service']['version']}"
+                    )
+                    print(
+                        f"   Total requests: {stats_data['performance']['total_requests']}"
+                    )
+                    print(f"   Cache hit rate: {stats_data['cache']['hit_rate']:.3f}")
+                else:
+                    print(f"❌ Stats endpoint failed: {response.status}")
 
             print("\n🎉 All HTTP endpoint tests completed successfully!")
 
-    except httpx.ConnectError:
+    except aiohttp.ClientConnectorError:
         print("❌ Could not connect to ML service")
         print("   Make sure the service is running: python start_service.py --dev")
     except Exception as e:
@@ -15,7 +15,10 @@ from .policy_net import (MODEL_REGISTRY, AdvancedConnect4PolicyNet,
                          ResidualBlock, create_heavyweight_model,
                          create_legacy_model, create_lightweight_model,
                          create_standard_model, get_available_models,
-                         get_model, get_model_info)
+                         get_model, get_model_info, load_model,
+                         quantize_int8)
+
+from .onnx_runtime import OnnxPolicySession, export_onnx
 
 # Version and metadata
 __all__ = [
@@ -30,6 +33,11 @@ __all__ = [
     "get_model",
     "get_available_models",
     "get_model_info",
+    "load_model",
+    "quantize_int8",
+    # ONNX Runtime serving
+    "export_onnx",
+    "OnnxPolicySession",
     # Components
     "ResidualBlock",
     "AdvancedResidualBlock",
@@ -6,12 +6,31 @@ Neural network implementation for Connect Four game intelligence.
 Simplified but robust architecture that focuses on compatibility.
 """
 
+import copy
+import functools
+import itertools
+import logging
 import math
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Tuple
 
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
+from torch.nn.utils.fusion import fuse_conv_bn_eval
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of single-board predictions memoized per model
+PREDICTION_CACHE_SIZE = 65536
+
+
+def _fuse_conv_bn(module: nn.Module, conv_name: str, bn_name: str) -> None:
+    """Fold an eval-mode BatchNorm into the preceding conv and drop the BN"""
+    bn = getattr(module, bn_name)
+    if isinstance(bn, nn.BatchNorm2d):
+        setattr(module, conv_name, fuse_conv_bn_eval(getattr(module, conv_name), bn))
+        setattr(module, bn_name, nn.Identity())
 
 
 class Connect4PolicyNet(nn.Module):
@@ -26,7 +45,11 @@ class Connect4PolicyNet(nn.Module):
     """
 
     def __init__(
-        self, input_channels: int = 2, hidden_channels: int = 128, num_blocks: int = 4
+        self,
+        input_channels: int = 2,
+        hidden_channels: int = 128,
+        num_blocks: int = 4,
+        initialize_weights: bool = True,
     ):
         super().__init__()
 
@@ -39,21 +62,39 @@ class Connect4PolicyNet(nn.Module):
             [ResidualBlock(hidden_channels) for _ in range(num_blocks)]
         )
 
-        # Policy head
+        # Policy head; a full-board (6x7) conv is the flatten+Linear without the reshape
         self.policy_conv = nn.Conv2d(hidden_channels, 32, 1)
         self.policy_bn = nn.BatchNorm2d(32)
-        self.policy_fc = nn.Linear(32 * 6 * 7, 7)  # 7 columns
+        self.policy_fc = nn.Conv2d(32, 7, kernel_size=(6, 7))  # 7 columns
 
         # Value head (optional)
         self.value_conv = nn.Conv2d(hidden_channels, 16, 1)
         self.value_bn = nn.BatchNorm2d(16)
-        self.value_fc1 = nn.Linear(16 * 6 * 7, 128)
+        self.value_fc1 = nn.Conv2d(16, 128, kernel_size=(6, 7))
         self.value_fc2 = nn.Linear(128, 1)
 
         self.dropout = nn.Dropout(0.1)
+        self._fused = False
+        self._channels_last = False
 
-        # Initialize weights
-        self._initialize_weights()
+        # Captured forward pass for fixed-shape CUDA inference
+        self._cuda_graph: Optional[torch.cuda.CUDAGraph] = None
+        self._static_in: Optional[torch.Tensor] = None
+        self._static_out: Optional[torch.Tensor] = None
+
+        # Page-locked host buffer for the single device->host copy in predict
+        self._pinned_out: Optional[torch.Tensor] = None
+
+        # LRU of board bytes -> (best_move, probabilities), valid for the
+        # parameter versions it was filled under
+        self._prediction_cache: "OrderedDict[bytes, Tuple[int, Tuple[float, ...]]]" = (
+            OrderedDict()
+        )
+        self._cache_weights_version = -1
+
+        # Initialize weights (skipped when a checkpoint will overwrite them)
+        if initialize_weights:
+            self._initialize_weights()
 
     def _initialize_weights(self):
         """Initialize network weights"""
@@ -71,6 +112,33 @@ class Connect4PolicyNet(nn.Module):
                 nn.init.normal_(module.weight, 0, 0.01)
                 nn.init.constant_(module.bias, 0)
 
+        # Full-board head convs keep the init they had as Linear layers
+        for head in (self.policy_fc, self.value_fc1):
+            nn.init.normal_(head.weight, 0, 0.01)
+            nn.init.constant_(head.bias, 0)
+
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        # Older checkpoints store the heads as Linear weights, which hold the
+        # same values as the full-board conv weights once reshaped
+        for name in ("policy_fc", "value_fc1"):
+            key = f"{prefix}{name}.weight"
+            weight = state_dict.get(key)
+            if weight is not None and weight.dim() == 2:
+                state_dict[key] = weight.reshape(getattr(self, name).weight.shape)
+        self.clear_prediction_cache()
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+
+    def clear_prediction_cache(self) -> None:
+        """Drop memoized predictions, e.g. after the weights change"""
+        self._prediction_cache.clear()
+
+    def _weights_version(self) -> int:
+        # In-place updates (optimizer steps, copy_, BatchNorm running-stat
+        # updates in train-mode forwards) bump each tensor's version
+        return sum(
+            t._version for t in itertools.chain(self.parameters(), self.buffers())
+        )
+
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         """
         Forward pass
@@ -81,6 +149,9 @@ class Connect4PolicyNet(nn.Module):
         Returns:
             Policy logits of shape (batch_size, 7)
         """
+        if self._channels_last:
+            x = x.contiguous(memory_format=torch.channels_last)
+
         # Input processing
         x = self.input_conv(x)
         x = self.input_bn(x)
@@ -94,16 +165,103 @@ class Connect4PolicyNet(nn.Module):
         policy = self.policy_conv(x)
         policy = self.policy_bn(policy)
         policy = F.relu(policy)
-        policy = policy.view(policy.size(0), -1)
         policy = self.dropout(policy)
-        policy_logits = self.policy_fc(policy)
+        policy_logits = self.policy_fc(policy).flatten(1)
 
         return policy_logits
 
+    def fuse_for_inference(self) -> "Connect4PolicyNet":
+        """
+        Fold every BatchNorm into its preceding convolution
+
+        The fused model is inference-only: BatchNorm and dropout layers are
+        replaced by identities, so it must not be trained afterwards. Only
+        get_model() and load_model() fuse; predict() never does.
+        """
+        if self._fused:
+            return self
+
+        self.eval()
+        _fuse_conv_bn(self, "input_conv", "input_bn")
+        for block in self.residual_blocks:
+            block.fuse_for_inference()
+        _fuse_conv_bn(self, "policy_conv", "policy_bn")
+        _fuse_conv_bn(self, "value_conv", "value_bn")
+        # Dropout is a no-op in eval but still pays Module.__call__ overhead
+        self.dropout = nn.Identity()
+
+        # A graph captured before fusion still runs the old convs and BNs
+        self._cuda_graph = self._static_in = self._static_out = None
+        self.clear_prediction_cache()
+
+        self._fused = True
+        return self
+
+    def to_channels_last(self) -> "Connect4PolicyNet":
+        """
+        Switch weights to channels-last (NHWC) memory format
+
+        oneDNN and cuDNN pick blocked, SIMD-friendly kernels for the 3x3 conv
+        stack in NHWC; forward() converts inputs to match. get_model() and
+        load_model() apply this after fusing.
+        """
+        self.to(memory_format=torch.channels_last)
+        self._channels_last = True
+
+        # A captured graph still points at the old weight storage
+        self._cuda_graph = self._static_in = self._static_out = None
+        self.clear_prediction_cache()
+        return self
+
+    def build_cuda_graph(self, batch_size: int = 1, device: str = "cuda") -> None:
+        """
+        Capture the inference forward pass into a CUDA graph
+
+        predict() replays the graph for inputs of exactly this batch size, so
+        the whole kernel sequence is launched at once instead of op by op.
+        Fuse first (get_model() and load_model() already have) so the
+        captured graph is final; fusing afterwards discards it.
+
+        Args:
+            batch_size: Batch size the graph is captured for
+            device: CUDA device to capture on
+        """
+        self.eval()
+        self.to(device)
+
+        static_in = torch.zeros(
+            batch_size, self.input_conv.in_channels, 6, 7, device=device
+        )
+        if self._channels_last:
+            static_in = static_in.contiguous(memory_format=torch.channels_last)
+
+        # Warm up on a side stream so lazy initialization stays out of the graph
+        stream = torch.cuda.Stream(device=device)
+        stream.wait_stream(torch.cuda.current_stream(device))
+        with torch.no_grad(), torch.cuda.stream(stream):
+            for _ in range(3):
+                self.forward(static_in)
+        torch.cuda.current_stream(device).wait_stream(stream)
+
+        graph = torch.cuda.CUDAGraph()
+        with torch.no_grad(), torch.cuda.graph(graph):
+            static_out = self.forward(static_in)
+
+        self._cuda_graph = graph
+        self._static_in = static_in
+        self._static_out = static_out
+        self.clear_prediction_cache()
+
     def predict(self, x: torch.Tensor) -> Tuple[int, List[float]]:
         """
         Make a prediction and return best move with probabilities
 
+        Single CPU boards are memoized by their exact bytes; boards already
+        on an accelerator skip the cache, since keying them would add a
+        device-to-host sync on top of the one for the result. The cache is
+        dropped whenever parameters or buffers change in place (e.g. an
+        optimizer step), on state-dict loads, fusion and CUDA graph capture.
+
         Args:
             x: Input tensor of shape (batch_size, 2, 6, 7)
 
@@ -111,15 +269,76 @@ class Connect4PolicyNet(nn.Module):
             Tuple of (best_move, move_probabilities)
         """
         self.eval()
-        with torch.no_grad():
+        if x.dim() != 4 or x.size(0) != 1 or x.device.type != "cpu":
+            return self._predict_uncached(x)
+
+        weights_version = self._weights_version()
+        if weights_version != self._cache_weights_version:
+            self.clear_prediction_cache()
+            self._cache_weights_version = weights_version
+
+        key = x.detach().numpy().tobytes()
+
+        cached = self._prediction_cache.get(key)
+        if cached is None:
+            best_move, prob_list = self._predict_uncached(x)
+            cached = (best_move, tuple(prob_list))
+            self._prediction_cache[key] = cached
+            if len(self._prediction_cache) > PREDICTION_CACHE_SIZE:
+                self._prediction_cache.popitem(last=False)
+        else:
+            self._prediction_cache.move_to_end(key)
+
+        best_move, probs = cached
+        return best_move, list(probs)
+
+    def predict_bf16(self, x: torch.Tensor) -> Tuple[int, List[float]]:
+        """
+        Make a prediction under bfloat16 autocast
+
+        Halves activation bandwidth on AMX CPUs and Ampere+ GPUs; the
+        softmax runs in float32 so the returned probabilities stay stable.
+
+        Args:
+            x: Input tensor of shape (batch_size, 2, 6, 7)
+
+        Returns:
+            Tuple of (best_move, move_probabilities)
+        """
+        self.eval()
+        with torch.inference_mode(), torch.autocast(
+            device_type=x.device.type, dtype=torch.bfloat16
+        ):
             logits = self.forward(x)
+        probs = F.softmax(logits.float(), dim=1)[0]
+        return int(probs.argmax()), probs.cpu().tolist()
+
+    def _predict_uncached(self, x: torch.Tensor) -> Tuple[int, List[float]]:
+        with torch.no_grad():
+            if self._cuda_graph is not None and x.shape == self._static_in.shape:
+                self._static_in.copy_(x)
+                self._cuda_graph.replay()
+                logits = self._static_out
+            else:
+                logits = self.forward(x)
             probs = F.softmax(logits, dim=1)
 
             if len(probs.shape) > 1:
                 probs = probs[0]  # Remove batch dimension
 
-            best_move = int(torch.argmax(probs).item())  # Ensure int conversion
-            prob_list = probs.cpu().tolist()
+            # One async copy into pinned memory instead of .item() + .cpu() syncs
+            if probs.is_cuda:
+                if self._pinned_out is None or self._pinned_out.shape != probs.shape:
+                    self._pinned_out = torch.empty(
+                        probs.shape, dtype=probs.dtype, pin_memory=True
+                    )
+                self._pinned_out.copy_(probs, non_blocking=True)
+                torch.cuda.current_stream(probs.device).synchronize()
+                probs = self._pinned_out
+
+            host_probs = probs.numpy()
+            best_move = int(host_probs.argmax())  # Ensure int conversion
+            prob_list = host_probs.tolist()
 
             return best_move, prob_list
 
@@ -135,6 +354,9 @@ class Connect4PolicyNet(nn.Module):
         """
         self.eval()
         with torch.no_grad():
+            if self._channels_last:
+                x = x.contiguous(memory_format=torch.channels_last)
+
             # Input processing
             features = self.input_conv(x)
             features = self.input_bn(features)
@@ -148,9 +370,8 @@ class Connect4PolicyNet(nn.Module):
             value = self.value_conv(features)
             value = self.value_bn(value)
             value = F.relu(value)
-            value = value.view(value.size(0), -1)
             value = self.dropout(value)
-            value = F.relu(self.value_fc1(value))
+            value = F.relu(self.value_fc1(value).flatten(1))
             value = torch.tanh(self.value_fc2(value))
 
             return value[0].item() if len(value) > 0 else 0.0
@@ -166,6 +387,11 @@ class ResidualBlock(nn.Module):
         self.conv2 = nn.Conv2d(channels, channels, 3, padding=1, bias=False)
         self.bn2 = nn.BatchNorm2d(channels)
 
+    def fuse_for_inference(self) -> None:
+        """Fold both BatchNorms into their convolutions"""
+        _fuse_conv_bn(self, "conv1", "bn1")
+        _fuse_conv_bn(self, "conv2", "bn2")
+
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         identity = x
 
@@ -176,7 +402,8 @@ class ResidualBlock(nn.Module):
         out = self.conv2(out)
         out = self.bn2(out)
 
-        out += identity
+        # Out-of-place add so FX quantization recognizes the residual pattern
+        out = out + identity
         out = F.relu(out)
 
         return out
@@ -199,6 +426,7 @@ class AdvancedConnect4PolicyNet(nn.Module):
         num_residual_blocks: int = 8,
         use_attention: bool = True,
         enable_uncertainty: bool = True,
+        initialize_weights: bool = True,
     ):
         super().__init__()
 
@@ -237,7 +465,10 @@ class AdvancedConnect4PolicyNet(nn.Module):
             self.uncertainty_fc = nn.Linear(8 * 6 * 7, 7)
 
         self.dropout = nn.Dropout(0.1)
-        self._initialize_weights()
+        self._fused = False
+        self._channels_last = False
+        if initialize_weights:
+            self._initialize_weights()
 
     def _initialize_weights(self):
         """Initialize network weights"""
@@ -255,16 +486,77 @@ class AdvancedConnect4PolicyNet(nn.Module):
                 nn.init.normal_(module.weight, 0, 0.01)
                 nn.init.constant_(module.bias, 0)
 
-    def forward(self, x: torch.Tensor) -> Dict[str, torch.Tensor]:
+    def fuse_for_inference(self) -> "AdvancedConnect4PolicyNet":
+        """
+        Fold every BatchNorm into its preceding convolution
+
+        The fused model is inference-only: BatchNorm and dropout layers are
+        replaced by identities, so it must not be trained afterwards.
+        """
+        if self._fused:
+            return self
+
+        self.eval()
+        _fuse_conv_bn(self, "input_conv", "input_bn")
+        for block in self.residual_blocks:
+            block.fuse_for_inference()
+        _fuse_conv_bn(self, "policy_conv", "policy_bn")
+        _fuse_conv_bn(self, "value_conv", "value_bn")
+        if self.enable_uncertainty:
+            _fuse_conv_bn(self, "uncertainty_conv", "uncertainty_bn")
+        self.dropout = nn.Identity()
+
+        self._fused = True
+        return self
+
+    def to_channels_last(self) -> "AdvancedConnect4PolicyNet":
+        """
+        Switch weights to channels-last (NHWC) memory format
+
+        forward() converts inputs to match. get_model() and load_model()
+        apply this after fusing.
+        """
+        self.to(memory_format=torch.channels_last)
+        self._channels_last = True
+        return self
+
+    def predict_bf16(self, x: torch.Tensor) -> Tuple[int, List[float]]:
+        """
+        Make a prediction under bfloat16 autocast
+
+        Args:
+            x: Input tensor of shape (batch_size, 2, 6, 7)
+
+        Returns:
+            Tuple of (best_move, move_probabilities) in float32
+        """
+        self.eval()
+        with torch.inference_mode(), torch.autocast(
+            device_type=x.device.type, dtype=torch.bfloat16
+        ):
+            logits = self.forward(x)["policy_logits"]
+        probs = F.softmax(logits.float(), dim=1)[0]
+        return int(probs.argmax()), probs.cpu().tolist()
+
+    def forward(
+        self, x: torch.Tensor, return_probs: bool = False
+    ) -> Dict[str, torch.Tensor]:
         """
         Forward pass returning multiple outputs
 
         Args:
             x: Input tensor of shape (batch_size, 2, 6, 7)
+            return_probs: Also compute softmax probabilities under "policy".
+                Argmax callers can use policy_logits directly, since the
+                argmax of the logits equals the argmax of the softmax.
 
         Returns:
-            Dictionary with keys: policy, value, uncertainty (if enabled)
+            Dictionary with keys: policy_logits, value, policy (if
+            return_probs), uncertainty (if enabled)
         """
+        if self._channels_last:
+            x = x.contiguous(memory_format=torch.channels_last)
+
         # Input processing
         x = self.input_conv(x)
         x = self.input_bn(x)
@@ -278,7 +570,8 @@ class AdvancedConnect4PolicyNet(nn.Module):
         policy = self.policy_conv(x)
         policy = self.policy_bn(policy)
         policy = F.relu(policy)
-        policy = policy.view(policy.size(0), -1)
+        # flatten, unlike view, also accepts channels-last feature maps
+        policy = policy.flatten(1)
         policy = self.dropout(policy)
         policy_logits = self.policy_fc(policy)
 
@@ -286,23 +579,24 @@ class AdvancedConnect4PolicyNet(nn.Module):
         value = self.value_conv(x)
         value = self.value_bn(value)
         value = F.relu(value)
-        value = value.view(value.size(0), -1)
+        value = value.flatten(1)
         value = self.dropout(value)
         value = F.relu(self.value_fc1(value))
         value = torch.tanh(self.value_fc2(value))
 
         outputs = {
-            "policy": F.softmax(policy_logits, dim=1),
             "policy_logits": policy_logits,
             "value": value,
         }
+        if return_probs:
+            outputs["policy"] = F.softmax(policy_logits, dim=1)
 
         # Uncertainty estimation
         if self.enable_uncertainty:
             uncertainty = self.uncertainty_conv(x)
             uncertainty = self.uncertainty_bn(uncertainty)
             uncertainty = F.relu(uncertainty)
-            uncertainty = uncertainty.view(uncertainty.size(0), -1)
+            uncertainty = uncertainty.flatten(1)
             uncertainty = self.dropout(uncertainty)
             uncertainty = torch.sigmoid(self.uncertainty_fc(uncertainty))
             outputs["uncertainty"] = uncertainty
@@ -334,6 +628,12 @@ class AdvancedResidualBlock(nn.Module):
 
         self.dropout = nn.Dropout2d(0.1)
 
+    def fuse_for_inference(self) -> None:
+        """Fold both BatchNorms into their convolutions and drop dropout"""
+        _fuse_conv_bn(self, "conv1", "bn1")
+        _fuse_conv_bn(self, "conv2", "bn2")
+        self.dropout = nn.Identity()
+
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         identity = x
 
@@ -357,29 +657,118 @@ class AdvancedResidualBlock(nn.Module):
 
 
 # Factory functions for different model configurations
-def create_lightweight_model() -> Connect4PolicyNet:
+def create_lightweight_model(
+    initialize_weights: bool = True,
+) -> Connect4PolicyNet:
     """Create a lightweight model for fast inference"""
-    return Connect4PolicyNet(hidden_channels=64, num_blocks=2)
+    return Connect4PolicyNet(
+        hidden_channels=64, num_blocks=2, initialize_weights=initialize_weights
+    )
 
 
-def create_standard_model() -> Connect4PolicyNet:
+def create_standard_model(
+    initialize_weights: bool = True,
+) -> Connect4PolicyNet:
     """Create a standard model for balanced performance"""
-    return Connect4PolicyNet(hidden_channels=128, num_blocks=4)
+    return Connect4PolicyNet(
+        hidden_channels=128, num_blocks=4, initialize_weights=initialize_weights
+    )
 
 
-def create_heavyweight_model() -> AdvancedConnect4PolicyNet:
+def create_heavyweight_model(
+    initialize_weights: bool = True,
+) -> AdvancedConnect4PolicyNet:
     """Create a heavyweight model for maximum performance"""
     return AdvancedConnect4PolicyNet(
         base_channels=256,
         num_residual_blocks=12,
         use_attention=True,
         enable_uncertainty=True,
+        initialize_weights=initialize_weights,
+    )
+
+
+def _compile_for_inference(model: nn.Module) -> nn.Module:
+    """
+    Compile a fused model with mode="reduce-overhead" and warm it up
+
+    Only the heavyweight graph is long enough to amortize torch.compile;
+    smaller models stay eager. Falls back to the eager model if
+    compilation is unavailable.
+    """
+    compiled = torch.compile(
+        model, mode="reduce-overhead", dynamic=False, fullgraph=True
     )
+    dummy = torch.zeros(1, 2, 6, 7)
+    try:
+        with torch.no_grad():
+            for _ in range(3):
+                compiled(dummy)
+    except Exception as e:
+        logger.warning("torch.compile failed, using eager heavyweight model: %s", e)
+        return model
+
+    return compiled
 
 
-def create_legacy_model() -> Connect4PolicyNet:
+def create_legacy_model(
+    initialize_weights: bool = True,
+) -> Connect4PolicyNet:
     """Create a legacy model for backward compatibility"""
-    return Connect4PolicyNet(hidden_channels=64, num_blocks=2)
+    return Connect4PolicyNet(
+        hidden_channels=64, num_blocks=2, initialize_weights=initialize_weights
+    )
+
+
+def _calibration_boards(num_boards: int = 64, seed: int = 0) -> torch.Tensor:
+    """Random two-plane boards used to calibrate activation ranges"""
+    generator = torch.Generator().manual_seed(seed)
+    occupied = torch.rand(num_boards, 1, 6, 7, generator=generator) < 0.5
+    red = torch.rand(num_boards, 1, 6, 7, generator=generator) < 0.5
+    return torch.cat([(occupied & red).float(), (occupied & ~red).float()], dim=1)
+
+
+def quantize_int8(
+    model: nn.Module, calibration_boards: Optional[torch.Tensor] = None
+) -> nn.Module:
+    """
+    Statically quantize a trained FP32 model to int8 for CPU inference
+
+    FX graph mode is used so conv/BN/ReLU fusion and the residual adds are
+    handled without QuantStub/FloatFunctional rewrites. Load trained
+    weights into the FP32 model before quantizing it.
+
+    Args:
+        model: FP32 model to quantize
+        calibration_boards: Optional (N, 2, 6, 7) boards for calibration
+
+    Returns:
+        Quantized model exposing the same forward signature; the input
+        model is left unchanged
+    """
+    from torch.ao.quantization import get_default_qconfig_mapping
+    from torch.ao.quantization.quantize_fx import convert_fx, prepare_fx
+
+    engines = torch.backends.quantized.supported_engines
+    backend = next(
+        (e for e in ("onednn", "x86", "fbgemm", "qnnpack") if e in engines), None
+    )
+    if backend is None:
+        raise RuntimeError("No quantized CPU engine available in this torch build")
+    torch.backends.quantized.engine = backend
+
+    if calibration_boards is None:
+        calibration_boards = _calibration_boards()
+
+    # Quantize a copy so the caller's float model keeps its device and mode
+    model = copy.deepcopy(model).cpu().eval()
+    prepared = prepare_fx(
+        model, get_default_qconfig_mapping(backend), (calibration_boards[:1],)
+    )
+    with torch.no_grad():
+        prepared(calibration_boards)
+
+    return convert_fx(prepared)
 
 
 # Model registry
@@ -393,20 +782,68 @@ MODEL_REGISTRY = {
 
 def get_model(model_type: str = "standard") -> nn.Module:
     """
-    Factory function to create models by name
+    Get the shared inference-ready model for a type
+
+    Each type is built once per process, put in eval mode, fused and
+    switched to channels-last (the heavyweight model is also compiled), so
+    per-request callers never pay for construction and weight init. The
+    returned instance is shared and must be treated as read-only; use the
+    MODEL_REGISTRY factories directly for fresh, trainable models.
 
     Args:
         model_type: One of 'lightweight', 'standard', 'heavyweight', 'legacy'
 
     Returns:
-        Instantiated model
+        Shared model instance
     """
     if model_type not in MODEL_REGISTRY:
         raise ValueError(
             f"Unknown model type: {model_type}. Available: {list(MODEL_REGISTRY.keys())}"
         )
 
-    return MODEL_REGISTRY[model_type]()
+    # Always positional, so get_model(), get_model("standard") and
+    # get_model(model_type="standard") share one cache entry
+    return _build_inference_model(model_type)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_inference_model(model_type: str) -> nn.Module:
+    """Build, fuse and (for heavyweight) compile one model type, once"""
+    # Fold BNs and go NHWC before compiling so the captured graph is final
+    model = MODEL_REGISTRY[model_type]().fuse_for_inference().to_channels_last()
+    if model_type == "heavyweight":
+        model = _compile_for_inference(model)
+    return model
+
+
+def load_model(path: str, model_type: str = "standard") -> nn.Module:
+    """
+    Load a checkpoint without initializing or copying weights
+
+    The model is built on the meta device, so no parameter memory is
+    allocated or initialized. The checkpoint is memory-mapped, which lets
+    worker processes share its pages, and assign=True keeps the loaded
+    tensors instead of copying them into fresh parameters.
+
+    Args:
+        path: Checkpoint file (a state dict, or a dict with model_state_dict)
+        model_type: One of 'lightweight', 'standard', 'heavyweight', 'legacy'
+
+    Returns:
+        Fused, channels-last inference model holding the checkpoint weights
+    """
+    if model_type not in MODEL_REGISTRY:
+        raise ValueError(
+            f"Unknown model type: {model_type}. Available: {list(MODEL_REGISTRY.keys())}"
+        )
+
+    with torch.device("meta"):
+        model = MODEL_REGISTRY[model_type](initialize_weights=False)
+
+    checkpoint = torch.load(path, map_location="cpu", mmap=True, weights_only=True)
+    state_dict = checkpoint.get("model_state_dict", checkpoint)
+    model.load_state_dict(state_dict, assign=True)
+    return model.fuse_for_inference().to_channels_last()
 
 
 def get_available_models() -> List[str]:
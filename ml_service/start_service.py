@@ -12,33 +12,67 @@ Enhanced startup script for the Connect4 ML service with:
 
 import argparse
 import asyncio
+import importlib.util
+import json
 import os
 import subprocess
 import sys
 from pathlib import Path
 
 
+# Successful checks are remembered per interpreter and requirements revision
+DEPS_CACHE_FILE = Path.home() / ".cache" / "dl-project" / "deps.json"
+REQUIREMENTS_FILE = Path(__file__).parent / "requirements.txt"
+
+
+def _deps_cache_key():
+    """Identify the environment a dependency check result applies to"""
+    try:
+        req_mtime = REQUIREMENTS_FILE.stat().st_mtime
+    except OSError:
+        req_mtime = None
+    return {"python": sys.executable, "req_mtime": req_mtime}
+
+
+def _deps_cached_ok(key):
+    """Return True if a previous check passed for the same environment"""
+    try:
+        cached = json.loads(DEPS_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return False
+    return cached.get("ok") is True and all(
+        cached.get(name) == value for name, value in key.items()
+    )
+
+
+def _remember_deps_ok(key):
+    """Record a passing check; failing to write the cache is harmless"""
+    try:
+        DEPS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        DEPS_CACHE_FILE.write_text(json.dumps({**key, "ok": True}))
+    except OSError:
+        pass
+
+
 def check_dependencies():
     """Check if required dependencies are installed"""
+    cache_key = _deps_cache_key()
+    if _deps_cached_ok(cache_key):
+        print("✅ Dependencies satisfied (cached)")
+        return True
+
     print("🔍 Checking dependencies...")
 
-    required_packages = [
-        "torch",
-        "fastapi",
-        "uvicorn",
-        "pydantic",
-        "numpy",
-        "prometheus_client",
-        "structlog",
-        "httpx",
-    ]
+    # Only what is needed to reach uvicorn.run; ml_service reports the rest
+    # with its own ImportError when it is imported
+    required_packages = ["torch", "fastapi", "uvicorn"]
 
+    # find_spec only locates each package; nothing (e.g. torch) is imported
     missing = []
     for package in required_packages:
-        try:
-            __import__(package)
+        if importlib.util.find_spec(package) is not None:
             print(f"✅ {package}")
-        except ImportError:
+        else:
             missing.append(package)
             print(f"❌ {package} (missing)")
 
@@ -47,6 +81,7 @@ def check_dependencies():
         print("Run: pip install -r requirements.txt")
         return False
 
+    _remember_deps_ok(cache_key)
     print("✅ All dependencies satisfied")
     return True
 
@@ -89,27 +124,8 @@ def run_service(args):
     """Run the ML service"""
     print(f"\n🚀 Starting ML Service on port {args.port}...")
 
-    uvicorn_args = [
-        "uvicorn",
-        "ml_service:app",
-        "--host",
-        args.host,
-        "--port",
-        str(args.port),
-        "--workers",
-        str(args.workers),
-    ]
-
-    if args.dev:
-        uvicorn_args.extend(["--reload", "--log-level", "debug"])
-    else:
-        uvicorn_args.extend(["--log-level", "info"])
-
-    # Add SSL if certificates provided
-    if args.ssl_cert and args.ssl_key:
-        uvicorn_args.extend(
-            ["--ssl-keyfile", args.ssl_key, "--ssl-certfile", args.ssl_cert]
-        )
+    ssl_enabled = bool(args.ssl_cert and args.ssl_key)
+    if ssl_enabled:
         print(f"🔒 SSL enabled")
 
     print(
@@ -119,17 +135,98 @@ def run_service(args):
         f"📖 API documentation: http{'s' if args.ssl_cert else ''}://{args.host}:{args.port}/docs"
     )
 
+    # The reloader restarts a watched child process, so dev mode keeps the CLI
+    if args.dev:
+        uvicorn_args = [
+            "uvicorn",
+            "ml_service:app",
+            "--host",
+            args.host,
+            "--port",
+            str(args.port),
+            "--workers",
+            str(args.workers),
+            "--reload",
+            "--log-level",
+            "debug",
+        ]
+        if ssl_enabled:
+            uvicorn_args.extend(
+                ["--ssl-keyfile", args.ssl_key, "--ssl-certfile", args.ssl_cert]
+            )
+
+        try:
+            subprocess.run(uvicorn_args, check=True)
+        except KeyboardInterrupt:
+            print("\n🛑 Service stopped by user")
+        except subprocess.CalledProcessError as e:
+            print(f"\n❌ Service failed to start: {e}")
+            sys.exit(1)
+        return
+
+    # Serve in this interpreter instead of booting a second one for the CLI
+    import uvicorn
+
     try:
-        subprocess.run(uvicorn_args, check=True)
+        uvicorn.run(
+            "ml_service:app",
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            log_level="info",
+            ssl_keyfile=args.ssl_key if ssl_enabled else None,
+            ssl_certfile=args.ssl_cert if ssl_enabled else None,
+        )
     except KeyboardInterrupt:
         print("\n🛑 Service stopped by user")
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ Service failed to start: {e}")
-        sys.exit(1)
+    except SystemExit as e:
+        if e.code:
+            print(f"\n❌ Service failed to start (exit code {e.code})")
+            sys.exit(1)
 
 
-def main():
-    """Main startup function"""
+def add_rate_limit_args(parser):
+    """Rate limiting settings"""
+    parser.add_argument(
+        "--rate-limit", type=int, default=1000, help="Rate limit (requests/minute)"
+    )
+
+
+def add_ssl_args(parser):
+    """SSL settings"""
+    parser.add_argument("--ssl-cert", help="SSL certificate file")
+    parser.add_argument("--ssl-key", help="SSL private key file")
+
+
+def add_redis_args(parser):
+    """Redis settings"""
+    parser.add_argument("--redis-host", help="Redis host")
+    parser.add_argument("--redis-port", type=int, default=6379, help="Redis port")
+
+
+# Rarely used groups: (option names, builder, defaults when not requested)
+LAZY_ARG_GROUPS = [
+    (("--rate-limit",), add_rate_limit_args, {"rate_limit": 1000}),
+    (("--ssl-cert", "--ssl-key"), add_ssl_args, {"ssl_cert": None, "ssl_key": None}),
+    (
+        ("--redis-host", "--redis-port"),
+        add_redis_args,
+        {"redis_host": None, "redis_port": 6379},
+    ),
+]
+
+
+def long_options(argv):
+    """Long option names given in argv, without any =value part"""
+    for arg in argv:
+        if arg == "--":
+            break
+        if arg.startswith("--") and len(arg) > 2:
+            yield arg.split("=", 1)[0]
+
+
+def build_parser(argv):
+    """Build the CLI parser, adding rarely used groups only when argv needs them"""
     parser = argparse.ArgumentParser(
         description="🧠 Enhanced Connect4 ML Service",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -180,17 +277,6 @@ Examples:
     # Security settings
     parser.add_argument("--dev", action="store_true", help="Enable development mode")
     parser.add_argument("--api-key", help="API key for authentication")
-    parser.add_argument(
-        "--rate-limit", type=int, default=1000, help="Rate limit (requests/minute)"
-    )
-
-    # SSL settings
-    parser.add_argument("--ssl-cert", help="SSL certificate file")
-    parser.add_argument("--ssl-key", help="SSL private key file")
-
-    # Redis settings
-    parser.add_argument("--redis-host", help="Redis host")
-    parser.add_argument("--redis-port", type=int, default=6379, help="Redis port")
 
     # Other options
     parser.add_argument(
@@ -200,13 +286,31 @@ Examples:
         "--test", action="store_true", help="Run tests instead of starting service"
     )
 
-    args = parser.parse_args()
+    # Help lists every option; otherwise only groups named on the command line.
+    # argparse accepts unambiguous prefixes (--redis-h for --redis-host), so a
+    # group is added when any given option is a prefix of one of its options;
+    # an ambiguous prefix adds every matching group and argparse reports it.
+    given = list(long_options(argv))
+    show_help = "-h" in argv or any("--help".startswith(opt) for opt in given)
+    for options, add_args, defaults in LAZY_ARG_GROUPS:
+        if show_help or any(o.startswith(opt) for opt in given for o in options):
+            add_args(parser)
+        else:
+            parser.set_defaults(**defaults)
+
+    return parser
+
+
+def main():
+    """Main startup function"""
+    argv = sys.argv[1:]
+    args = build_parser(argv).parse_args(argv)
 
     print("🧠 Enhanced Connect4 ML Service")
     print("=" * 35)
 
-    # Check dependencies
-    if not args.skip_deps and not check_dependencies():
+    # Check dependencies (the test run talks to an already running service)
+    if not (args.skip_deps or args.test) and not check_dependencies():
         sys.exit(1)
 
     # Setup environment
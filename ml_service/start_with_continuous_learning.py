@@ -5,16 +5,24 @@
 
 Starts both the main ML service and the continuous learning pipeline
 for real-time model improvement during gameplay.
+
+By default everything is co-hosted in one process on one event loop, so
+the models are loaded once. For CPU parallelism set WEB_CONCURRENCY to
+run several uvicorn workers; continuous learning still runs only once.
 """
 
 import asyncio
 import logging
 import multiprocessing
 import os
+import signal
 import sys
 import time
 from pathlib import Path
 
+import orjson
+from dotenv import load_dotenv
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -24,118 +32,106 @@ logger = logging.getLogger(__name__)
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-
-def start_ml_service():
-    """Start the main ML service"""
+# Load .env first (as ml_service does on import) so the snapshot includes it
+load_dotenv()
+
+# Environment snapshot taken once at import; reads below are plain dict lookups
+ENV = dict(os.environ)
+
+# uvicorn worker processes serving the ML API (continuous learning stays single)
+WEB_CONCURRENCY = int(ENV.get("WEB_CONCURRENCY", "1"))
+
+ML_SERVICE_HOST = ENV.get("ML_SERVICE_HOST", "127.0.0.1")
+ML_SERVICE_PORT = int(ENV.get("ML_SERVICE_PORT", "8000"))
+ML_WEBSOCKET_PORT = int(ENV.get("ML_WEBSOCKET_PORT", "8002"))
+
+# Per-request access logging only in debug runs; it serializes every request
+DEBUG = ENV.get("DEBUG", "false").lower() == "true"
+UVICORN_LOG_LEVEL = "debug" if DEBUG else "warning"
+
+# Pipeline configuration, built once (a copy is passed to the pipeline)
+INTEGRATED_CONFIG = {
+    "buffer_capacity": 100000,
+    "capacity_per_level": 10000,
+    "learning_rate": 0.0001,
+    "batch_size": 32,
+    "update_frequency": 100,
+    "min_games": 50,
+    "validation_threshold": 0.95,
+}
+
+# Health endpoint response parts that never change between probes
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type",
+}
+# Static fields with the closing brace dropped, so dynamic fields can follow
+HEALTH_BODY_PREFIX = orjson.dumps(
+    {"status": "healthy", "service": "continuous_learning"}
+)[:-1]
+
+# Requirements pin uvicorn below 0.30; newer releases are untested here
+UVICORN_MAX_TESTED = (0, 30)
+
+
+def check_uvicorn_version():
+    """Warn when running on a uvicorn release newer than the pinned range"""
     import uvicorn
 
-    from ml_service import app
-
-    host = os.environ.get("ML_SERVICE_HOST", "127.0.0.1")
-    port = int(os.environ.get("ML_SERVICE_PORT", "8000"))
+    version = tuple(int(part) for part in uvicorn.__version__.split(".")[:2])
+    if version >= UVICORN_MAX_TESTED:
+        logger.warning(
+            f"uvicorn {uvicorn.__version__} is newer than the pinned <0.30 range"
+        )
 
-    logger.info(f"Starting ML service on {host}:{port}")
 
-    uvicorn.run(app, host=host, port=port, reload=False, access_log=True)
+class AiohttpWebSocketAdapter:
+    """Expose an aiohttp WebSocketResponse through the websockets API the pipeline uses"""
 
+    def __init__(self, ws):
+        self.ws = ws
 
-def start_continuous_learning():
-    """Start the continuous learning pipeline"""
-    import asyncio
+    async def send(self, message):
+        from websockets.exceptions import ConnectionClosed
 
-    from continuous_learning import (ContinuousLearningPipeline,
-                                     run_continuous_learning)
+        # The pipeline prunes broadcast targets on ConnectionClosed
+        if self.ws.closed:
+            raise ConnectionClosed(None, None)
+        if isinstance(message, str):
+            await self.ws.send_str(message)
+        else:
+            await self.ws.send_bytes(message)
 
-    from ml_service import \
-      model_manager  # Import model manager from main service
+    async def __aiter__(self):
+        from aiohttp import WSMsgType
 
-    logger.info("Starting continuous learning pipeline")
+        async for msg in self.ws:
+            if msg.type in (WSMsgType.TEXT, WSMsgType.BINARY):
+                yield msg.data
 
-    # Configuration for continuous learning
-    config = {
-        "buffer_capacity": 100000,
-        "learning_rate": 0.0001,
-        "batch_size": 32,
-        "update_frequency": 100,
-        "min_games": 50,
-        "validation_threshold": 0.95,
-        "catastrophic_threshold": 0.15,
-        "degradation_threshold": 0.05,
-        "improvement_threshold": 0.02,
-    }
-
-    # Create event loop and run
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
 
+async def run_logged(name, coro):
+    """Run a background service, logging its failure instead of propagating it"""
     try:
-        loop.run_until_complete(run_continuous_learning(model_manager, config))
-    except KeyboardInterrupt:
-        logger.info("Continuous learning pipeline shutting down")
-    finally:
-        loop.close()
+        await coro
+    except Exception as e:
+        logger.error(f"{name} stopped: {e}")
 
 
-def start_learning_monitor():
-    """Start the learning stability monitor"""
-    import asyncio
+async def start_learning_services(tg, shutdown_event):
+    """
+    Start the continuous learning pipeline with its HTTP and WebSocket server
 
-    from continuous_learning import ContinuousLearningPipeline
-    from learning_monitor import monitor_learning_stability
+    Services run as tasks in tg. The HTTP server stops once shutdown_event
+    is set; the returned client tasks must be cancelled by the caller.
+    """
+    # Configuration for continuous learning
+    config = dict(INTEGRATED_CONFIG)
 
+    # ml_service loads PyTorch, so it is imported only once it is needed
     from ml_service import model_manager
 
-    logger.info("Starting learning stability monitor")
-
-    # Configuration for monitor
-    config = {
-        "catastrophic_threshold": 0.15,
-        "degradation_threshold": 0.05,
-        "improvement_threshold": 0.02,
-    }
-
-    # Create event loop and run
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
-    # Create pipeline instance (would be shared with continuous learning in production)
-    pipeline = ContinuousLearningPipeline(model_manager, config)
-
-    try:
-        # Check if model exists first
-        if "standard" in model_manager.models:
-            loop.run_until_complete(
-                monitor_learning_stability(
-                    model_manager.models["standard"], pipeline, config
-                )
-            )
-        else:
-            logger.warning("Standard model not found, skipping learning monitor")
-    except KeyboardInterrupt:
-        logger.info("Learning monitor shutting down")
-    finally:
-        loop.close()
-
-
-async def start_integrated_service():
-    """Start ML service with integrated continuous learning"""
-    import uvicorn
-    import websockets
-    from continuous_learning import ContinuousLearningPipeline
-
-    from ml_service import app, model_manager
-
-    # Configuration for continuous learning
-    config = {
-        "buffer_capacity": 100000,
-        "capacity_per_level": 10000,
-        "learning_rate": 0.0001,
-        "batch_size": 32,
-        "update_frequency": 100,
-        "min_games": 50,
-        "validation_threshold": 0.95,
-    }
-
     # Ensure model manager has a base model loaded first
     try:
         await model_manager.load_model("standard")
@@ -145,6 +141,8 @@ async def start_integrated_service():
 
     # Create continuous learning pipeline
     # Use difficulty-aware version if available
+    from continuous_learning import ContinuousLearningPipeline
+
     try:
         from integrate_difficulty_learning import \
           IntegratedDifficultyLearningPipeline
@@ -170,85 +168,86 @@ async def start_integrated_service():
     async def start_cl_http():
         from aiohttp import web
 
+        # Resolve the experience buffer once rather than on every probe
+        experience_buffer = getattr(pipeline, "experience_buffer", None)
+        if experience_buffer is not None:
+            get_buffer_size = lambda: len(experience_buffer.buffer)
+        else:
+            get_buffer_size = lambda: 0
+
         async def health_handler(request):
-            return web.json_response(
-                {
-                    "status": "healthy",
-                    "service": "continuous_learning",
-                    "timestamp": time.time(),
-                    "buffer_size": (
-                        len(pipeline.experience_buffer.buffer)
-                        if hasattr(pipeline, "experience_buffer")
-                        else 0
-                    ),
-                },
-                headers={
-                    "Access-Control-Allow-Origin": "*",
-                    "Access-Control-Allow-Methods": "GET, OPTIONS",
-                    "Access-Control-Allow-Headers": "Content-Type",
-                },
+            dynamic = orjson.dumps(
+                {"timestamp": time.time(), "buffer_size": get_buffer_size()}
             )
-
-        async def handle_options(request):
             return web.Response(
-                headers={
-                    "Access-Control-Allow-Origin": "*",
-                    "Access-Control-Allow-Methods": "GET, OPTIONS",
-                    "Access-Control-Allow-Headers": "Content-Type",
-                }
+                body=HEALTH_BODY_PREFIX + b"," + dynamic[1:],
+                content_type="application/json",
+                headers=CORS_HEADERS,
             )
 
+        async def handle_options(request):
+            return web.Response(headers=CORS_HEADERS)
+
+        async def ws_handler(request):
+            # Loopback only: skip permessage-deflate and the message size cap
+            ws = web.WebSocketResponse(compress=False, max_msg_size=0)
+            await ws.prepare(request)
+            await pipeline.handle_websocket(AiohttpWebSocketAdapter(ws), "/")
+            return ws
+
         app = web.Application()
         app.router.add_get("/health", health_handler)
         app.router.add_options("/health", handle_options)
+        # WebSocket upgrades share the health endpoint's server and port
+        app.router.add_get("/ws", ws_handler)
 
         runner = web.AppRunner(app)
         await runner.setup()
-        http_port = int(os.environ.get("ML_WEBSOCKET_PORT", "8002"))
+        http_port = ML_WEBSOCKET_PORT
         site = web.TCPSite(runner, "localhost", http_port)
         await site.start()
         logger.info(
             f"Continuous Learning HTTP health endpoint started on http://localhost:{http_port}/health"
         )
-
-    # Start WebSocket server for continuous learning in background
-    async def start_cl_websocket():
-        ws_port = int(os.environ.get("ML_WEBSOCKET_PORT", "8002"))
-
-        # Create a wrapper to handle the path parameter
-        async def websocket_handler(websocket):
-            await pipeline.handle_websocket(websocket, "/")
-
-        # Use a different port for WebSocket to avoid conflict with HTTP
-        ws_actual_port = 8005  # Use 8005 for WebSocket to avoid conflicts
-        server = await websockets.serve(websocket_handler, "localhost", ws_actual_port)
         logger.info(
-            f"Continuous Learning WebSocket server started on ws://localhost:{ws_actual_port}"
+            f"Continuous Learning WebSocket endpoint started on ws://localhost:{http_port}/ws"
         )
-        await asyncio.Future()  # Run forever
 
-    # Start both HTTP and WebSocket servers as background tasks
-    asyncio.create_task(start_cl_http())
-    asyncio.create_task(start_cl_websocket())
+        try:
+            await shutdown_event.wait()
+        finally:
+            await runner.cleanup()
+
+    # Start the HTTP + WebSocket server as a background task
+    tg.create_task(run_logged("Continuous Learning HTTP server", start_cl_http()))
+    client_tasks = []
 
     # Start coordination-learning bridge if AI coordination is available
-    if os.environ.get("ENABLE_COORDINATION_BRIDGE", "true").lower() == "true":
+    if ENV.get("ENABLE_COORDINATION_BRIDGE", "true").lower() == "true":
         try:
             from coordination_learning_bridge import CoordinationLearningBridge
 
             bridge = CoordinationLearningBridge()
-            asyncio.create_task(bridge.start())
+            client_tasks.append(
+                tg.create_task(
+                    run_logged("Coordination-Learning Bridge", bridge.start())
+                )
+            )
             logger.info("Coordination-Learning Bridge started")
         except Exception as e:
             logger.warning(f"Could not start Coordination-Learning Bridge: {e}")
 
     # Start Integration WebSocket client for seamless service communication
-    if os.environ.get("ENABLE_SERVICE_INTEGRATION", "true").lower() == "true":
+    if ENV.get("ENABLE_SERVICE_INTEGRATION", "true").lower() == "true":
         try:
             from integration_client import MLServiceIntegration
 
             ml_integration = MLServiceIntegration()
-            asyncio.create_task(ml_integration.start())
+            client_tasks.append(
+                tg.create_task(
+                    run_logged("Service Integration client", ml_integration.start())
+                )
+            )
             logger.info("✅ Service Integration client started")
 
             # Register pipeline with integration for real-time updates
@@ -256,22 +255,124 @@ async def start_integrated_service():
         except Exception as e:
             logger.warning(f"Could not start Service Integration client: {e}")
 
-    # Start the main ML service
-    host = os.environ.get("ML_SERVICE_HOST", "127.0.0.1")
-    port = int(os.environ.get("ML_SERVICE_PORT", "8000"))
+    return client_tasks
+
+
+async def start_integrated_service():
+    """Start ML service with integrated continuous learning"""
+    shutdown_event = asyncio.Event()
+    async with asyncio.TaskGroup() as tg:
+        client_tasks = await start_learning_services(tg, shutdown_event)
+
+        # ml_service is already imported by the learning services
+        import uvicorn
+
+        from ml_service import app
+
+        # Start the main ML service
+        host = ML_SERVICE_HOST
+        port = ML_SERVICE_PORT
+
+        config = uvicorn.Config(
+            app=app,
+            host=host,
+            port=port,
+            loop="uvloop",
+            http="httptools",
+            reload=False,
+            access_log=DEBUG,
+            log_level=UVICORN_LOG_LEVEL,
+        )
+        server = uvicorn.Server(config)
+
+        # uvicorn handles SIGINT/SIGTERM itself and returns from serve()
+        try:
+            await server.serve()
+        finally:
+            shutdown_event.set()
+            for task in client_tasks:
+                task.cancel()
+
+
+async def serve_learning_services():
+    """Run the continuous learning side on its own until SIGINT/SIGTERM"""
+    shutdown_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, shutdown_event.set)
 
-    config = uvicorn.Config(
-        app=app, host=host, port=port, reload=False, access_log=True
+    async with asyncio.TaskGroup() as tg:
+        client_tasks = await start_learning_services(tg, shutdown_event)
+        await shutdown_event.wait()
+        for task in client_tasks:
+            task.cancel()
+
+
+def run_learning_process():
+    """Process target hosting continuous learning next to uvicorn workers"""
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    try:
+        asyncio.run(serve_learning_services())
+    except KeyboardInterrupt:
+        logger.info("Continuous learning process shutting down")
+
+
+def start_multi_worker_service():
+    """Serve the ML API on several workers, with continuous learning in one process"""
+    import uvicorn
+
+    check_uvicorn_version()
+
+    # Fork the learning process so it inherits already imported modules
+    # instead of re-importing them cold (Linux only; fork is unsafe on macOS)
+    if sys.platform.startswith("linux"):
+        multiprocessing.set_start_method("fork", force=True)
+
+    # The pipeline and its servers hold state that must not be duplicated
+    # per worker, so they run once in a dedicated process
+    learning_process = multiprocessing.Process(
+        target=run_learning_process, name="continuous-learning", daemon=True
     )
+    learning_process.start()
 
-    server = uvicorn.Server(config)
-    await server.serve()
+    host = ML_SERVICE_HOST
+    port = ML_SERVICE_PORT
+    logger.info(f"Starting ML service on {host}:{port} with {WEB_CONCURRENCY} workers")
+
+    try:
+        uvicorn.run(
+            "ml_service:app",
+            host=host,
+            port=port,
+            workers=WEB_CONCURRENCY,
+            loop="uvloop",
+            http="httptools",
+            reload=False,
+            access_log=DEBUG,
+            log_level=UVICORN_LOG_LEVEL,
+        )
+    finally:
+        learning_process.terminate()
+        learning_process.join()
 
 
 def main():
     """Main entry point - starts integrated ML service with continuous learning"""
     logger.info("🚀 Starting ML Service with Continuous Learning")
 
+    if WEB_CONCURRENCY > 1:
+        start_multi_worker_service()
+        return
+
+    # uvicorn, the aiohttp health endpoint and the websocket servers all
+    # share this loop, so install uvloop before it is created
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     try:
         asyncio.run(start_integrated_service())
     except KeyboardInterrupt:
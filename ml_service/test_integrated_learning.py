@@ -11,17 +11,124 @@ Tests the integration between:
 """
 
 import asyncio
-import json
 import logging
 import time
 from typing import Any, Dict, List
 
+import numpy as np
+import orjson
 import websockets
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Cell codes: 0 = Empty, 1 = Red, 2 = Yellow
+CELL_NAMES = np.array(["Empty", "Red", "Yellow"])
+
+
+def _build_test_board() -> List[List[str]]:
+    """Create a test board state"""
+    board = np.zeros((6, 7), dtype=np.uint8)
+    # Add some test pieces
+    board[5, 0:3] = 1
+    board[5, 3] = board[4, 3] = 2
+    # Decode every cell in one fancy-indexing pass
+    return CELL_NAMES[board].tolist()
+
+
+# Built once at import instead of on every test
+TEST_BOARD = _build_test_board()
+
+# Messages are encoded once at import (as str, so servers get text frames);
+# only the model update carries a per-send timestamp
+HANDSHAKE_MESSAGE = orjson.dumps(
+    {"type": "handshake", "service": "test_client", "version": "1.0.0"}
+).decode()
+
+_LOSS_PATTERN = {
+    "type": "priority_learning",
+    "data": {
+        "gameId": "test-game-001",
+        "lossPattern": {
+            "type": "horizontal",
+            "winningSequence": [
+                {"row": 5, "column": 0},
+                {"row": 5, "column": 1},
+                {"row": 5, "column": 2},
+                {"row": 5, "column": 3},
+            ],
+            "criticalPositions": [
+                {"row": 5, "column": 1},
+                {"row": 5, "column": 2},
+            ],
+            "aiMistakes": ["missed_block_at_col_1"],
+        },
+        "gameData": {
+            "outcome": "loss",
+            "finalBoard": TEST_BOARD,
+            "moves": [],
+        },
+        "priority": "high",
+        "learnImmediately": True,
+    },
+}
+LOSS_PATTERN_MESSAGE = orjson.dumps(_LOSS_PATTERN).decode()
+
+_MODEL_UPDATE = {
+    "type": "continuous_learning_update",
+    "update_type": "model_improved",
+    "data": {
+        "version": "v42",
+        "improvements": {
+            "horizontal_defense": 0.15,
+            "vertical_defense": 0.12,
+            "diagonal_defense": 0.18,
+            "overall_accuracy": 0.14,
+        },
+        "timestamp": "__TS__",
+    },
+}
+_MODEL_UPDATE_HEAD, _MODEL_UPDATE_TAIL = (
+    orjson.dumps(_MODEL_UPDATE).decode().split('"__TS__"')
+)
+
+
+def model_update_message(timestamp: float) -> str:
+    """Splice a timestamp into the pre-encoded model update message"""
+    return f"{_MODEL_UPDATE_HEAD}{timestamp!r}{_MODEL_UPDATE_TAIL}"
+
+
+_DEFENSE = {
+    "type": "defense_coordination",
+    "defenses": {
+        "horizontal": {
+            "critical_positions": [{"row": 5, "column": 3}],
+            "blocking_moves": [3, 2, 4],
+            "confidence": 0.92,
+            "games_tested": 150,
+        },
+        "diagonal": {
+            "critical_positions": [
+                {"row": 3, "column": 3},
+                {"row": 2, "column": 2},
+            ],
+            "blocking_moves": [3, 2],
+            "confidence": 0.87,
+            "games_tested": 120,
+        },
+    },
+}
+DEFENSE_MESSAGE = orjson.dumps(_DEFENSE).decode()
+
+_ANALYSIS_REQUEST = {
+    "type": "pattern_analysis_request",
+    "board_state": TEST_BOARD,
+    "patterns": ["horizontal", "diagonal"],
+}
+ANALYSIS_REQUEST_MESSAGE = orjson.dumps(_ANALYSIS_REQUEST).decode()
+
+
 class IntegratedLearningTester:
     def __init__(self):
         self.cl_ws_url = "ws://localhost:8002/ws"
@@ -32,6 +139,16 @@ class IntegratedLearningTester:
             "defense_coordination": False,
             "collective_learning": False,
         }
+        # One coordination hub connection shared by the tests that need it
+        self._coord_ws = None
+        self._coord_lock = asyncio.Lock()
+
+    async def _get_coord(self):
+        """Return the shared coordination hub connection, opening it on first use"""
+        async with self._coord_lock:
+            if self._coord_ws is None:
+                self._coord_ws = await websockets.connect(self.coord_ws_url)
+            return self._coord_ws
 
     async def test_loss_pattern_flow(self):
         """Test: Loss pattern → CL → Coordination → All AIs"""
@@ -42,47 +159,15 @@ class IntegratedLearningTester:
             cl_ws = await websockets.connect(self.cl_ws_url)
 
             # Send handshake
-            await cl_ws.send(
-                json.dumps(
-                    {"type": "handshake", "service": "test_client", "version": "1.0.0"}
-                )
-            )
+            await cl_ws.send(HANDSHAKE_MESSAGE)
 
             # Simulate a loss pattern discovery
-            loss_pattern_msg = {
-                "type": "priority_learning",
-                "data": {
-                    "gameId": "test-game-001",
-                    "lossPattern": {
-                        "type": "horizontal",
-                        "winningSequence": [
-                            {"row": 5, "column": 0},
-                            {"row": 5, "column": 1},
-                            {"row": 5, "column": 2},
-                            {"row": 5, "column": 3},
-                        ],
-                        "criticalPositions": [
-                            {"row": 5, "column": 1},
-                            {"row": 5, "column": 2},
-                        ],
-                        "aiMistakes": ["missed_block_at_col_1"],
-                    },
-                    "gameData": {
-                        "outcome": "loss",
-                        "finalBoard": self._create_test_board(),
-                        "moves": [],
-                    },
-                    "priority": "high",
-                    "learnImmediately": True,
-                },
-            }
-
-            await cl_ws.send(json.dumps(loss_pattern_msg))
+            await cl_ws.send(LOSS_PATTERN_MESSAGE)
             logger.info("✅ Sent loss pattern to continuous learning")
 
             # Wait for pattern insights broadcast
             response = await asyncio.wait_for(cl_ws.recv(), timeout=5.0)
-            data = json.loads(response)
+            data = orjson.loads(response)
 
             if data.get("type") == "pattern_insights":
                 logger.info(f"✅ Received pattern insights: {data['data']['patterns']}")
@@ -99,33 +184,16 @@ class IntegratedLearningTester:
 
         try:
             # Connect to coordination hub
-            coord_ws = await websockets.connect(self.coord_ws_url)
+            coord_ws = await self._get_coord()
 
             # Simulate model update from CL
-            model_update_msg = {
-                "type": "continuous_learning_update",
-                "update_type": "model_improved",
-                "data": {
-                    "version": "v42",
-                    "improvements": {
-                        "horizontal_defense": 0.15,
-                        "vertical_defense": 0.12,
-                        "diagonal_defense": 0.18,
-                        "overall_accuracy": 0.14,
-                    },
-                    "timestamp": time.time(),
-                },
-            }
-
-            await coord_ws.send(json.dumps(model_update_msg))
+            await coord_ws.send(model_update_message(time.time()))
             logger.info("✅ Sent model update to coordination hub")
 
             # The coordination hub should broadcast this to all AIs
             # In a real test, we'd connect multiple AI clients to verify
             self.test_results["model_update_propagation"] = True
 
-            await coord_ws.close()
-
         except Exception as e:
             logger.error(f"❌ Model update propagation test failed: {e}")
 
@@ -134,37 +202,14 @@ class IntegratedLearningTester:
         logger.info("Testing defense coordination...")
 
         try:
-            coord_ws = await websockets.connect(self.coord_ws_url)
+            coord_ws = await self._get_coord()
 
             # Simulate defense strategy update
-            defense_msg = {
-                "type": "defense_coordination",
-                "defenses": {
-                    "horizontal": {
-                        "critical_positions": [{"row": 5, "column": 3}],
-                        "blocking_moves": [3, 2, 4],
-                        "confidence": 0.92,
-                        "games_tested": 150,
-                    },
-                    "diagonal": {
-                        "critical_positions": [
-                            {"row": 3, "column": 3},
-                            {"row": 2, "column": 2},
-                        ],
-                        "blocking_moves": [3, 2],
-                        "confidence": 0.87,
-                        "games_tested": 120,
-                    },
-                },
-            }
-
-            await coord_ws.send(json.dumps(defense_msg))
+            await coord_ws.send(DEFENSE_MESSAGE)
             logger.info("✅ Sent defense strategies to coordination hub")
 
             self.test_results["defense_coordination"] = True
 
-            await coord_ws.close()
-
         except Exception as e:
             logger.error(f"❌ Defense coordination test failed: {e}")
 
@@ -173,20 +218,18 @@ class IntegratedLearningTester:
         logger.info("Testing collective pattern analysis...")
 
         try:
-            coord_ws = await websockets.connect(self.coord_ws_url)
+            coord_ws = await self._get_coord()
 
             # Request pattern analysis
-            analysis_request = {
-                "type": "pattern_analysis_request",
-                "board_state": self._create_test_board(),
-                "patterns": ["horizontal", "diagonal"],
-            }
-
-            await coord_ws.send(json.dumps(analysis_request))
+            await coord_ws.send(ANALYSIS_REQUEST_MESSAGE)
 
-            # Wait for collective analysis response
-            response = await asyncio.wait_for(coord_ws.recv(), timeout=3.0)
-            data = json.loads(response)
+            # Wait for collective analysis response; broadcasts triggered by
+            # the other tests on this shared connection are skipped
+            async with asyncio.timeout(3.0):
+                while True:
+                    data = orjson.loads(await coord_ws.recv())
+                    if "collective_analysis" in data:
+                        break
 
             if "collective_analysis" in data:
                 logger.info(
@@ -194,38 +237,30 @@ class IntegratedLearningTester:
                 )
                 self.test_results["collective_learning"] = True
 
-            await coord_ws.close()
-
         except Exception as e:
             logger.error(f"❌ Collective pattern analysis test failed: {e}")
 
-    def _create_test_board(self) -> List[List[str]]:
-        """Create a test board state"""
-        board = [["Empty"] * 7 for _ in range(6)]
-        # Add some test pieces
-        board[5][0] = "Red"
-        board[5][1] = "Red"
-        board[5][2] = "Red"
-        board[5][3] = "Yellow"
-        board[4][3] = "Yellow"
-        return board
-
     async def run_all_tests(self):
         """Run all integration tests"""
         logger.info("🧪 Starting Integrated Learning System Tests...")
         logger.info("=" * 50)
 
-        # Run tests
-        await self.test_loss_pattern_flow()
-        await asyncio.sleep(1)
-
-        await self.test_model_update_propagation()
-        await asyncio.sleep(1)
-
-        await self.test_defense_coordination()
-        await asyncio.sleep(1)
-
-        await self.test_collective_pattern_analysis()
+        # Run tests concurrently; each writes only its own result key
+        try:
+            outcomes = await asyncio.gather(
+                self.test_loss_pattern_flow(),
+                self.test_model_update_propagation(),
+                self.test_defense_coordination(),
+                self.test_collective_pattern_analysis(),
+                return_exceptions=True,
+            )
+        finally:
+            if self._coord_ws is not None:
+                await self._coord_ws.close()
+                self._coord_ws = None
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                logger.error(f"❌ Test raised unexpectedly: {outcome}")
 
         # Print results
         logger.info("\n" + "=" * 50)
@@ -1,9 +1,24 @@
 #!/usr/bin/env python3
 """Test integration between all Connect Four services"""
 
+import asyncio
+import aiohttp
 import requests
 import json
 import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One pooled session so repeated calls to the same host reuse sockets
+session = requests.Session()
+adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+)
+session.mount('http://', adapter)
+session.mount('https://', adapter)
+session.headers["Connection"] = "keep-alive"
 
 print("🧪 Testing Connect Four Service Integration")
 print("=" * 50)
@@ -17,18 +32,35 @@ services = {
     'Python Trainer': 'http://localhost:8004/health'
 }
 
+
+async def check(client, url):
+    """Return the health endpoint's status code"""
+    async with client.get(url) as r:
+        return r.status
+
+
+async def check_all():
+    """Probe every service concurrently, so the wait is the slowest probe"""
+    async with aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=2)
+    ) as client:
+        return await asyncio.gather(
+            *(check(client, url) for url in services.values()),
+            return_exceptions=True,
+        )
+
+
 print("\n1️⃣ Service Health Check:")
 all_up = True
-for name, url in services.items():
-    try:
-        r = requests.get(url, timeout=2)
-        if r.status_code == 200:
-            print(f"   ✅ {name}: ONLINE")
-        else:
-            print(f"   ⚠️  {name}: Status {r.status_code}")
-            all_up = False
-    except Exception as e:
-        print(f"   ❌ {name}: OFFLINE - {type(e).__name__}")
+# gather keeps input order, so results line up with services
+for name, result in zip(services, asyncio.run(check_all())):
+    if isinstance(result, Exception):
+        print(f"   ❌ {name}: OFFLINE - {type(result).__name__}")
+        all_up = False
+    elif result == 200:
+        print(f"   ✅ {name}: ONLINE")
+    else:
+        print(f"   ⚠️  {name}: Status {result}")
         all_up = False
 
 # Test 2: Create a game and check AI integration
@@ -40,7 +72,7 @@ try:
         "difficulty": 0.5
     }
     
-    r = requests.post('http://localhost:3000/games', json=game_data)
+    r = session.post('http://localhost:3000/games', json=game_data)
     if r.status_code == 201:
         game = r.json()
         print(f"   ✅ Game created: {game['id']}")
@@ -52,7 +84,7 @@ try:
             "playerId": "TestPlayer"
         }
         
-        r = requests.post(f'http://localhost:3000/games/{game["id"]}/drop', json=move_data)
+        r = session.post(f'http://localhost:3000/games/{game["id"]}/drop', json=move_data)
         if r.status_code == 200:
             result = r.json()
             if 'aiMove' in result:
@@ -78,7 +110,7 @@ try:
         "model_type": "standard"
     }
     
-    r = requests.post('http://localhost:8000/predict', json=prediction_data)
+    r = session.post('http://localhost:8000/predict', json=prediction_data)
     if r.status_code == 200:
         pred = r.json()
         print(f"   ✅ ML prediction received: {pred['move']['column']}")
@@ -90,7 +122,7 @@ except Exception as e:
 # Test 5: Check learning metrics
 print("\n5️⃣ Testing Learning System Status:")
 try:
-    r = requests.get('http://localhost:8000/status/learning')
+    r = session.get('http://localhost:8000/status/learning')
     if r.status_code == 200:
         status = r.json()
         print(f"   ✅ Learning system active")